@@ -0,0 +1,17 @@
+"""Memoized config loading shared by the helper scripts.
+
+Config objects are treated as read-only by the scripts, so the parsed YAML
+can be reused for every lookup of the same path.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from twickenham_events.config import Config
+
+
+@lru_cache(maxsize=8)
+def load_cfg(path: str = "config/config.yaml") -> Config:
+    """Return the parsed Config for path, parsing the YAML only once."""
+    return Config.from_file(path)
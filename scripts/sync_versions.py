@@ -14,10 +14,37 @@ Usage:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
 import re
 import subprocess
 import sys
+import threading
+
+# File updates are IO-bound; threads let the read/write syscalls overlap.
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# sw_version patterns per file type. YAML updates the key; Python only updates
+# assignments, never annotations such as "sw_version: str".
+_YAML_SW_VERSION = re.compile(r'(\s*sw_version:\s*)["\']?[^"\'\n]*["\']?')
+SW_VERSION_PATTERNS = {
+    ".yaml": _YAML_SW_VERSION,
+    ".yml": _YAML_SW_VERSION,
+    ".py": re.compile(r'(\bsw_version\s*=\s*)["\'][^"\']*["\']'),
+}
+
+PYPROJECT_VERSION_RE = re.compile(r'^version = "(?P<version>[^"]+)"', re.MULTILINE)
+
+# Top-level directories never treated as legacy-layout packages
+SKIP_TOP_DIRS = frozenset({"src", "tests", "docs", "node_modules", "build", "dist"})
+
+
+def _is_hidden(path: Path) -> bool:
+    """True if any component of path starts with a dot (.venv, .git, ...)."""
+    # One substring test instead of a generator over path.parts; as_posix
+    # normalises Windows separators and the leading "/" covers relative paths
+    return "/." in "/" + path.as_posix()
 
 
 class VersionSync:
@@ -26,6 +53,7 @@ class VersionSync:
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
         self.pyproject_path = self.project_root / "pyproject.toml"
+        self._print_lock = threading.Lock()
         self.version = self._get_pyproject_version()
         self.git_version = self._get_git_version()
 
@@ -34,19 +62,10 @@ class VersionSync:
         if not self.pyproject_path.exists():
             raise FileNotFoundError(f"pyproject.toml not found in {self.project_root}")
 
-        content = self.pyproject_path.read_text()
-
-        # Try Poetry format first: version = "x.y.z"
-        match = re.search(r'^version = "([^"]+)"', content, re.MULTILINE)
-        if match:
-            return match.group(1)
-
-        # Try PEP 621 format: version = "x.y.z"
-        match = re.search(
-            r'^\[project\].*?^version = "([^"]+)"', content, re.MULTILINE | re.DOTALL
-        )
+        # Poetry and PEP 621 share the same line syntax, so one scan suffices
+        match = PYPROJECT_VERSION_RE.search(self.pyproject_path.read_text())
         if match:
-            return match.group(1)
+            return match.group("version")
 
         raise ValueError("Version not found in pyproject.toml")
 
@@ -98,7 +117,7 @@ class VersionSync:
             if (
                 path.is_dir()
                 and not path.name.startswith(".")
-                and path.name not in ["src", "tests", "docs"]
+                and path.name not in SKIP_TOP_DIRS
             ):
                 init_file = path / "__init__.py"
                 if init_file.exists():
@@ -120,12 +139,12 @@ class VersionSync:
         for pattern in patterns:
             for file_path in self.project_root.glob(pattern):
                 # Skip files in .venv, .git, __pycache__ etc
-                if not any(part.startswith(".") for part in file_path.parts):
+                if not _is_hidden(file_path):
                     ha_files.extend([file_path])
 
         # Also look for Python files with device definitions
         for py_file in self.project_root.rglob("*.py"):
-            if not any(part.startswith(".") for part in py_file.parts):
+            if not _is_hidden(py_file):
                 # Skip the version sync script itself to prevent self-modification
                 if py_file.name == "sync_versions.py":
                     continue
@@ -161,11 +180,11 @@ class VersionSync:
         if content != new_content:
             if not check_only:
                 init_path.write_text(new_content)
-                print(
+                self._report(
                     f"✅ Updated {init_path.relative_to(self.project_root)}: {self.version}"
                 )
             else:
-                print(
+                self._report(
                     f"⚠️  Version mismatch in {init_path.relative_to(self.project_root)}"
                 )
             return True
@@ -187,42 +206,34 @@ class VersionSync:
             # Skip binary files
             return False
 
-        suffix = ha_path.suffix.lower()
-        updated = False
-        new_content = content
-
-        if suffix in [".yaml", ".yml"]:
-            # YAML: only update YAML-style keys
-            pattern = r'(\s*sw_version:\s*)["\']?[^"\'\n]*["\']?'
-            if re.search(pattern, content):
-                replacement = rf'\1"{self.version}"'
-                new_content = re.sub(pattern, replacement, new_content)
-                updated = True
-        elif suffix == ".py":
-            # Python: only update assignment, not annotations
-            pattern = r'(\bsw_version\s*=\s*)["\'][^"\']*["\']'
-            if re.search(pattern, content):
-                replacement = rf'\1"{self.version}"'
-                new_content = re.sub(pattern, replacement, new_content)
-                updated = True
-        else:
+        pattern = SW_VERSION_PATTERNS.get(ha_path.suffix.lower())
+        if pattern is None:
             # Other file types are ignored
             return False
 
+        # Single scan: subn reports whether anything matched
+        new_content, count = pattern.subn(rf'\1"{self.version}"', content)
+        updated = count > 0
+
         if updated and content != new_content:
             if not check_only:
                 ha_path.write_text(new_content)
-                print(
+                self._report(
                     f"✅ Updated {ha_path.relative_to(self.project_root)}: {self.version}"
                 )
             else:
-                print(
+                self._report(
                     f"⚠️  HA version mismatch in {ha_path.relative_to(self.project_root)}"
                 )
             return True
 
         return False
 
+    def _report(self, message: str) -> None:
+        """Print a status line without interleaving output from worker threads."""
+        with self._print_lock:
+            print(message)
+
     def sync_all(self, check_only: bool = False) -> dict[str, int]:
         """Synchronize versions in all relevant files."""
         results = {"init_files": 0, "ha_files": 0, "errors": 0}
@@ -233,23 +244,32 @@ class VersionSync:
         print(f"🔄 Git version: {self.git_version}")
         print()
 
-        # Update __init__.py files
-        for init_file in self.find_init_files():
-            try:
-                if self.update_init_file(init_file, check_only):
-                    results["init_files"] += 1
-            except Exception as e:
-                print(f"❌ Error updating {init_file}: {e}")
-                results["errors"] += 1
-
-        # Update HA config files
-        for ha_file in self.find_ha_config_files():
-            try:
-                if self.update_ha_config_file(ha_file, check_only):
-                    results["ha_files"] += 1
-            except Exception as e:
-                print(f"❌ Error updating {ha_file}: {e}")
-                results["errors"] += 1
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Update __init__.py files and HA config files concurrently
+            jobs = [
+                (
+                    "init_files",
+                    path,
+                    executor.submit(self.update_init_file, path, check_only),
+                )
+                for path in self.find_init_files()
+            ]
+            jobs.extend(
+                (
+                    "ha_files",
+                    path,
+                    executor.submit(self.update_ha_config_file, path, check_only),
+                )
+                for path in self.find_ha_config_files()
+            )
+
+            for key, path, future in jobs:
+                try:
+                    if future.result():
+                        results[key] += 1
+                except Exception as e:
+                    self._report(f"❌ Error updating {path}: {e}")
+                    results["errors"] += 1
 
         return results
 
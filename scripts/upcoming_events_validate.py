@@ -17,11 +17,17 @@ from __future__ import annotations
 import argparse
 from datetime import datetime
 import json
+import mmap
 import os
 import re
 import sys
 from typing import Any
 
+try:  # optional fast path; stdlib json is used when orjson is unavailable
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 TIME_RE = re.compile(r"^\d{2}:\d{2}$")
 
@@ -49,6 +55,14 @@ def parse_args() -> argparse.ArgumentParser:
 
 
 def load_json(path: str) -> Any:
+    if orjson is not None and os.path.getsize(path) > 0:
+        # Parse straight from the mapped file, no intermediate bytes copy
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            return orjson.loads(view)
     with open(path, encoding="utf-8") as f:
         return json.load(f)
 
@@ -1,3 +1,4 @@
+import hashlib
 from pathlib import Path
 
 # Path to the consolidated guide
@@ -6,6 +7,12 @@ GUIDE_PATH = (
 )
 README_PATH = Path(__file__).parent.parent / "twickenham_events/README.md"
 
+# Key of the inputs the AI last settled on; lets no-op runs skip the API call
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+LAST_KEY_PATH = CACHE_DIR / "update_docs_last_key"
+# Touched after each settled run; newer than both inputs means nothing to read
+STAMP_PATH = CACHE_DIR / "update_docs.stamp"
+
 # Helper: Read file
 
 
@@ -19,6 +26,35 @@ def write_file(path, content):
         f.write(content)
 
 
+def inputs_key(readme, guide, context):
+    """Content hash of everything that feeds the AI prompt."""
+    data = "\0".join((guide, readme, context)).encode("utf-8")
+    return hashlib.blake2b(data).hexdigest()
+
+
+def read_last_key():
+    try:
+        return LAST_KEY_PATH.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def write_last_key(key):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_file(LAST_KEY_PATH, key)
+    STAMP_PATH.touch()
+
+
+def inputs_unmodified():
+    """True if neither input file changed since the last settled run."""
+    try:
+        stamp_mtime = STAMP_PATH.stat().st_mtime
+        inputs_mtime = max(GUIDE_PATH.stat().st_mtime, README_PATH.stat().st_mtime)
+    except OSError:
+        return False
+    return stamp_mtime >= inputs_mtime
+
+
 # Helper: Use Copilot/AI agent for doc update
 
 
@@ -26,6 +62,8 @@ def ai_update_readme(readme, guide, context):
     """
     Use Gemini 2.5 Pro API to rewrite README using the consolidated guide and recent context.
     Requires: pip install google-generativeai
+
+    Returns None when the update was skipped or the API call failed.
     """
     import os
 
@@ -34,7 +72,7 @@ def ai_update_readme(readme, guide, context):
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         print("GEMINI_API_KEY not set. Skipping AI update.")
-        return readme
+        return None
     genai.configure(api_key=api_key)
     prompt = (
         "Rewrite the following README.md for a Python project. "
@@ -53,24 +91,34 @@ def ai_update_readme(readme, guide, context):
         return updated
     except Exception as e:
         print(f"Gemini API call failed: {e}. Skipping AI update.")
-        return readme
+        return None
 
 
 # Main logic
 
 
 def main():
+    if inputs_unmodified():
+        print("README.md inputs unchanged since last run. Skipping AI update.")
+        return
     guide = read_file(GUIDE_PATH)
     readme = read_file(README_PATH)
     # Gather context: env/config/validator changes
     context = ""  # Could be git diff, or recent commit messages
+    if read_last_key() == inputs_key(readme, guide, context):
+        print("README.md inputs unchanged since last run. Skipping AI update.")
+        return
     # Call AI agent to update README
     updated_readme = ai_update_readme(readme, guide, context)
+    if updated_readme is None:
+        return
     if updated_readme != readme:
         write_file(README_PATH, updated_readme)
         print("README.md updated by AI agent.")
     else:
         print("README.md is already up to date.")
+    # Record the settled state so the next run with the same inputs is a no-op
+    write_last_key(inputs_key(updated_readme, guide, context))
 
 
 if __name__ == "__main__":
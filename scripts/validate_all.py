@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
-"""Run all artifact validators (ICS, upcoming_events, MQTT) in sequence.
+"""Run all artifact validators (ICS, upcoming_events, MQTT) concurrently.
 
-Return first failing exit code (1 for validation failure, 2 for IO/exec error) while
-printing a compact summary. Assumes scripts are executable with same Python.
+Validators are independent, so they run in a small thread pool; their output is
+captured and printed in a fixed order (ics, upcoming, mqtt). Each validator's
+``main(argv)`` is called in-process, falling back to a subprocess with the same
+Python if the module cannot be imported. Return first failing exit code (1 for
+validation failure, 2 for IO/exec error) while printing a compact summary.
 
 Usage examples:
   poetry run python scripts/validate_all.py --ics output/twickenham_events.ics \
@@ -14,19 +17,46 @@ You can skip a validator via the corresponding --no-* flag.
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+import importlib
+import io
 import json
+import mmap
+import os
 from pathlib import Path
+import ssl
 import subprocess
 import sys
+import threading
 import time
 
+try:  # MQTT is optional; only the --mqtt count retrieval needs paho
+    import paho.mqtt.client as mqtt  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    mqtt = None  # type: ignore
+
 try:
-    from twickenham_events.config import Config  # type: ignore
+    from paho.mqtt.client import CallbackAPIVersion  # type: ignore
+except Exception:  # pragma: no cover - paho < 2.0 or missing
+    CallbackAPIVersion = None  # type: ignore
+
+try:  # optional fast JSON decoder; both accept bytes directly
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+try:
+    from _cfgcache import Config, load_cfg  # type: ignore
 except Exception:  # pragma: no cover
     Config = None  # type: ignore
+    load_cfg = None  # type: ignore
 
 ROOT = Path(__file__).resolve().parent
 
+_TLS_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
 VALIDATORS = {
     "ics": "ics_validate.py",
     "upcoming": "upcoming_events_validate.py",
@@ -34,7 +64,7 @@ VALIDATORS = {
 }
 
 
-def parse_args():
+def parse_args(argv: list[str] | None = None):
     p = argparse.ArgumentParser(description="Run all validation scripts")
     p.add_argument(
         "--ics", default="output/twickenham_events.ics", help="ICS file path"
@@ -107,27 +137,329 @@ def parse_args():
         default=1.0,
         help="Delay seconds between MQTT count retrieval attempts",
     )
-    return p.parse_args()
+    return p.parse_args(argv)
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """stdout/stderr stand-in that sends writes to the calling thread's buffer.
+
+    contextlib.redirect_stdout swaps a process-wide attribute, so it cannot
+    separate validators running concurrently in worker threads.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, "buffer", None) or self._fallback
 
+    def write(self, s: str) -> int:
+        return self._target().write(s)
 
-def run_validator(kind: str, args_list: list[str]) -> int:
+    def flush(self) -> None:
+        self._target().flush()
+
+    @contextmanager
+    def capture(self):
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+
+def _install_routed_streams() -> None:
+    if not isinstance(sys.stdout, _ThreadRoutedStream):
+        sys.stdout = _ThreadRoutedStream(sys.stdout)
+    if not isinstance(sys.stderr, _ThreadRoutedStream):
+        sys.stderr = _ThreadRoutedStream(sys.stderr)
+
+
+def run_validator(kind: str, args_list: list[str]) -> tuple[int, str]:
+    """Run one validator; return (exit code, captured output).
+
+    Output is returned rather than printed so concurrent runs do not interleave.
+    """
+    try:
+        module = importlib.import_module(Path(VALIDATORS[kind]).stem)
+    except Exception:
+        return _run_validator_subprocess(kind, args_list)
+    out, err = sys.stdout, sys.stderr
+    if not isinstance(out, _ThreadRoutedStream) or not isinstance(
+        err, _ThreadRoutedStream
+    ):
+        return _run_validator_subprocess(kind, args_list)
+
+    header = f"→ Running {kind} validator: {VALIDATORS[kind]} {' '.join(args_list)}"
+    with out.capture() as captured_out, err.capture() as captured_err:
+        try:
+            rc = module.main(args_list)
+        except SystemExit as e:  # argparse errors
+            rc = e.code if isinstance(e.code, int) else 2
+        except Exception as e:
+            print(f"ERROR: {kind} validator raised: {e}")
+            rc = 2
+    lines = [header]
+    for text in (captured_out.getvalue(), captured_err.getvalue()):
+        if text:
+            lines.append(text.rstrip())
+    return rc, "\n".join(lines)
+
+
+def _run_validator_subprocess(kind: str, args_list: list[str]) -> tuple[int, str]:
+    """Run a validator script in a child process, streaming its output.
+
+    Lines are printed as they arrive, prefixed with [kind] so concurrent
+    validators stay readable; nothing is left to return as captured output.
+    """
     script = ROOT / VALIDATORS[kind]
     cmd = [sys.executable, str(script), *args_list]
-    print(f"→ Running {kind} validator: {' '.join(cmd)}")
+    prefix = f"[{kind}] "
+    print(f"{prefix}→ Running {kind} validator: {' '.join(cmd)}")
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            for line in proc.stdout:
+                print(f"{prefix}{line}", end="")
+            return proc.wait(), ""
     except Exception as e:
-        print(f"ERROR: failed invoking {kind} validator: {e}")
-        return 2
-    if proc.stdout:
-        print(proc.stdout.rstrip())
-    if proc.stderr:
-        print(proc.stderr.rstrip())
-    return proc.returncode
+        print(f"{prefix}ERROR: failed invoking {kind} validator: {e}")
+        return 2, ""
+
+
+def count_vevents(path: str) -> int:
+    """Count BEGIN:VEVENT lines with a byte scan of the mapped file.
+
+    mmap.find runs in C over the mapped pages, so no per-line decode/strip.
+    """
+    if os.path.getsize(path) == 0:
+        return 0  # mmap rejects zero-length files
+    needle = b"\nBEGIN:VEVENT"
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        count = 1 if mm[: len(needle) - 1] == needle[1:] else 0
+        pos = mm.find(needle)
+        while pos != -1:
+            count += 1
+            pos = mm.find(needle, pos + len(needle))
+    return count
+
+
+def _count_ics(path: str) -> int | None:
+    try:
+        return count_vevents(path)
+    except Exception as e:  # pragma: no cover
+        print(f"NOTE: failed reading ICS for count: {e}")
+        return None
+
+
+def _count_json(path: str) -> int | None:
+    try:
+        data = _loads(Path(path).read_bytes())
+        events = data.get("events") if isinstance(data, dict) else None
+        return len(events) if isinstance(events, list) else None
+    except Exception as e:  # pragma: no cover
+        print(f"NOTE: failed reading upcoming JSON for count: {e}")
+        return None
+
+
+@lru_cache(maxsize=2)
+def _ssl_ctx(verify: bool) -> ssl.SSLContext:
+    """Client TLS context, built (and the CA bundle loaded) once per mode."""
+    ctx = ssl.create_default_context()
+    if not verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def _fetch_mqtt_count(a) -> int | None:
+    """Read the retained all_upcoming payload and return its event count."""
+    try:
+        if mqtt is None:
+            print("NOTE: paho-mqtt not installed; skipping MQTT count retrieval")
+            return None
+
+        # Ensure loaded_cfg exists in this scope for static analysis
+        loaded_cfg = None  # type: ignore[assignment]
+        # Use same connection parameters as used above
+        resolved_broker = a.broker
+        resolved_port = a.mqtt_port
+        resolved_user = a.mqtt_username or os.getenv("MQTT_USERNAME")
+        resolved_pass = a.mqtt_password or os.getenv("MQTT_PASSWORD")
+        # Also detect TLS preference from config/env, not just port
+        cfg_tls_obj = None
+        if Config is not None and "loaded_cfg" in locals() and loaded_cfg is not None:
+            try:
+                cfg_tls_obj = loaded_cfg.get("mqtt.tls")
+            except Exception:
+                cfg_tls_obj = None
+
+        topic = "twickenham_events/events/all_upcoming"
+        received: dict[str, int] = {}
+        done = threading.Event()
+        subscribed = threading.Event()
+
+        def _on_connect(client, _ud, _flags, _rc, _props=None):  # type: ignore
+            # Initial subscribe; retained message should arrive quickly.
+            client.subscribe(topic)
+
+        def _on_message(_client, _ud, msg):  # type: ignore
+            try:
+                payload = _loads(msg.payload)
+            except Exception:  # pragma: no cover
+                return
+            # Prefer top-level count when available (current schema)
+            try:
+                if isinstance(payload, dict):
+                    if isinstance(payload.get("count"), int):
+                        received["count"] = int(payload["count"])
+                    else:
+                        evs = payload.get("events")
+                        if isinstance(evs, list):
+                            received["count"] = len(evs)
+                        else:
+                            evj = payload.get("events_json")
+                            if isinstance(evj, dict) and isinstance(
+                                evj.get("count"), int
+                            ):
+                                received["count"] = int(evj["count"])
+            except Exception:
+                pass
+            done.set()
+            _client.disconnect()
+
+        # One client (and one TLS context) shared by every retry attempt
+        if CallbackAPIVersion is not None:
+            client = mqtt.Client(
+                protocol=mqtt.MQTTv5,
+                callback_api_version=CallbackAPIVersion.VERSION2,
+            )
+        else:
+            client = mqtt.Client(protocol=mqtt.MQTTv5)
+        client.on_connect = _on_connect
+        client.on_message = _on_message
+        client.on_subscribe = lambda *_args: subscribed.set()
+
+        def _on_disconnect(*_args):  # type: ignore
+            # Wake every wait; nothing more will arrive on this connection
+            subscribed.set()
+            done.set()
+
+        client.on_disconnect = _on_disconnect
+
+        # Configure auth if provided via args or env
+        if resolved_user and resolved_pass:
+            try:
+                client.username_pw_set(resolved_user, resolved_pass)
+            except Exception:
+                pass
+
+        # Configure TLS if using TLS port or explicitly requested by env
+        # TLS port short-circuits; otherwise one env read against a frozenset
+        _use_tls = (
+            resolved_port == 8883
+            or os.getenv("MQTT_USE_TLS", "").lower() in _TLS_TRUTHY
+            or bool(cfg_tls_obj)
+        )
+        if _use_tls:
+            # Default to permissive TLS unless TLS_VERIFY explicitly requests verification
+            _tls_verify_env = os.getenv("TLS_VERIFY")
+            verify_flag = None
+            if _tls_verify_env is not None:
+                try:
+                    verify_flag = _tls_verify_env.lower() in (
+                        "true",
+                        "1",
+                        "yes",
+                        "on",
+                    )
+                except Exception:
+                    verify_flag = None
+            try:
+                if isinstance(cfg_tls_obj, dict):
+                    ca = cfg_tls_obj.get("ca_certs")
+                    certfile = cfg_tls_obj.get("certfile")
+                    keyfile = cfg_tls_obj.get("keyfile")
+                    if ca or certfile:
+                        client.tls_set(ca_certs=ca, certfile=certfile, keyfile=keyfile)
+                        if verify_flag is False:
+                            client.tls_insecure_set(True)
+                    elif verify_flag is True:
+                        client.tls_set_context(_ssl_ctx(True))  # strict verification
+                    else:
+                        client.tls_set_context(_ssl_ctx(False))  # permissive
+                        client.tls_insecure_set(True)
+                elif verify_flag is True:
+                    client.tls_set_context(_ssl_ctx(True))
+                else:
+                    client.tls_set_context(_ssl_ctx(False))
+                    client.tls_insecure_set(True)
+            except Exception:
+                pass
+
+        connected_once = False
+        try:
+            for attempt in range(1, a.mqtt_count_retries + 1):
+                received.clear()
+                done.clear()
+                subscribed.clear()
+                try:
+                    if connected_once:
+                        client.reconnect()
+                    else:
+                        client.connect(resolved_broker, resolved_port, 30)
+                        connected_once = True
+                except Exception as e:  # pragma: no cover
+                    if attempt == a.mqtt_count_retries:
+                        print(f"NOTE: MQTT count connect failed final attempt: {e}")
+                        break
+                    print(
+                        f"NOTE: MQTT count connect failed attempt {attempt}/{a.mqtt_count_retries}: {e} (retrying)"
+                    )
+                    time.sleep(a.mqtt_count_retry_delay)
+                    continue
+                client.loop_start()
+                deadline = time.monotonic() + 10.0
+                if not subscribed.wait(timeout=0.5) and not done.is_set():
+                    # No SUBACK yet: the only case a re-subscribe helps. Allow
+                    # the full window for a sluggish broker.
+                    try:
+                        client.subscribe(topic)
+                    except Exception:
+                        pass
+                    subscribed.wait(timeout=max(0.0, deadline - time.monotonic()))
+                # Retained messages follow the SUBACK within about one RTT, so
+                # once subscribed only a short grace period is needed.
+                done.wait(
+                    timeout=0.5
+                    if subscribed.is_set()
+                    else max(0.0, deadline - time.monotonic())
+                )
+                client.loop_stop()
+                if "count" in received:
+                    return received["count"]
+                if attempt < a.mqtt_count_retries:
+                    print(
+                        f"NOTE: MQTT count not received attempt {attempt}/{a.mqtt_count_retries} (retrying)"
+                    )
+                    time.sleep(a.mqtt_count_retry_delay)
+        finally:
+            client.loop_stop()
+            client.disconnect()
+    except Exception as e:  # pragma: no cover
+        print(f"NOTE: could not retrieve MQTT all_upcoming count: {e}")
+    return None
 
 
 def main(argv=None) -> int:  # pragma: no cover
-    a = parse_args()
+    a = parse_args(argv)
     overall_rc = 0
 
     if a.scrape_run:
@@ -151,28 +483,26 @@ def main(argv=None) -> int:  # pragma: no cover
             print(f"ERROR: scrape run failed: {e}")
             return 2
 
-    # ICS
+    # Collect (kind, args) for every enabled validator, in reporting order
+    jobs: list[tuple[str, list[str]]] = []
     if not a.no_ics:
-        rc = run_validator("ics", ["--file", a.ics])
-        if rc != 0:
-            overall_rc = rc if overall_rc == 0 else overall_rc
+        jobs.append(("ics", ["--file", a.ics]))
 
-    # Upcoming events
     if not a.no_upcoming:
         upcoming_args = ["--file", a.upcoming]
         if a.allow_empty_upcoming:
             upcoming_args.append("--allow-empty")
-        rc = run_validator("upcoming", upcoming_args)
-        if rc != 0 and overall_rc == 0:
-            overall_rc = rc
+        jobs.append(("upcoming", upcoming_args))
 
-    # MQTT (opt-in)
+    # MQTT (opt-in); an unresolved broker is reported after the file
+    # validators have run, as it was when they ran one after another
+    mqtt_error = None
     if a.mqtt:
         # Resolve broker/port/creds from config if defaults left in place
         loaded_cfg = None
         if Config is not None:
             try:
-                loaded_cfg = Config.from_file("config/config.yaml")
+                loaded_cfg = load_cfg("config/config.yaml")
             except Exception as e:  # pragma: no cover
                 print(f"NOTE: unable to load config for MQTT defaults: {e}")
         if a.broker == "localhost" and loaded_cfg is not None:
@@ -188,8 +518,10 @@ def main(argv=None) -> int:  # pragma: no cover
             a.mqtt_password = loaded_cfg.mqtt_password
 
         if a.broker == "localhost":
-            print("ERROR: broker still 'localhost' - specify --broker or set config")
-            return 2
+            mqtt_error = (
+                "ERROR: broker still 'localhost' - specify --broker or set config"
+            )
+    if a.mqtt and mqtt_error is None:
         effective_timeout = a.mqtt_timeout if a.mqtt_timeout is not None else a.timeout
         mqtt_args = [
             "--broker",
@@ -211,208 +543,60 @@ def main(argv=None) -> int:  # pragma: no cover
             mqtt_args.append("--include-discovery")
         if getattr(a, "mqtt_discovery_timeout", 0) and a.mqtt_discovery_timeout > 0:
             mqtt_args += ["--discovery-timeout", str(a.mqtt_discovery_timeout)]
-        rc = run_validator("mqtt", mqtt_args)
-        if rc != 0 and overall_rc == 0:
-            overall_rc = rc
-        mqtt_ok = rc == 0
-    else:
-        mqtt_ok = False
-
-    # Cross-artifact consistency: ICS vs upcoming (and MQTT if ok)
-    ics_count = None
-    json_count = None
-    try:
-        if not a.no_ics:
-            with open(a.ics, encoding="utf-8") as f:
-                ics_count = sum(1 for line in f if line.strip() == "BEGIN:VEVENT")
-    except Exception as e:  # pragma: no cover
-        print(f"NOTE: failed reading ICS for count: {e}")
+        jobs.append(("mqtt", mqtt_args))
+
+    # Independent I/O-bound validators: wall time becomes max() instead of sum().
+    # --mqtt-run-service rewrites the output files, so the mqtt job then waits
+    # until the file validators reading them have finished
+    deferred = [job for job in jobs if job[0] == "mqtt" and a.mqtt_run_service]
+    concurrent = [job for job in jobs if job not in deferred]
+    results: dict[str, int] = {}
+    # Route output per thread for this run only; in-process callers get
+    # their own streams back
+    saved_streams = sys.stdout, sys.stderr
+    _install_routed_streams()
     try:
-        if not a.no_upcoming:
-            with open(a.upcoming, encoding="utf-8") as f:
-                data = json.load(f)
-                events = data.get("events") if isinstance(data, dict) else None
-                if isinstance(events, list):
-                    json_count = len(events)
-    except Exception as e:  # pragma: no cover
-        print(f"NOTE: failed reading upcoming JSON for count: {e}")
-
-    mqtt_count = None
-    if mqtt_ok:
-        try:
-            import os
-            import ssl
-
-            import paho.mqtt.client as mqtt  # type: ignore
-
-            try:
-                from paho.mqtt.client import CallbackAPIVersion  # type: ignore
-            except Exception:  # pragma: no cover
-                CallbackAPIVersion = None  # type: ignore
-
-            # Ensure loaded_cfg exists in this scope for static analysis
-            loaded_cfg = None  # type: ignore[assignment]
-            # Use same connection parameters as used above
-            resolved_broker = a.broker
-            resolved_port = a.mqtt_port
-            resolved_user = a.mqtt_username or os.getenv("MQTT_USERNAME")
-            resolved_pass = a.mqtt_password or os.getenv("MQTT_PASSWORD")
-            # Also detect TLS preference from config/env, not just port
-            cfg_tls_obj = None
-            if (
-                Config is not None
-                and "loaded_cfg" in locals()
-                and loaded_cfg is not None
-            ):
-                try:
-                    cfg_tls_obj = loaded_cfg.get("mqtt.tls")
-                except Exception:
-                    cfg_tls_obj = None
-
-            for attempt in range(1, a.mqtt_count_retries + 1):
-                topic = "twickenham_events/events/all_upcoming"
-                received: dict[str, int] = {}
-
-                def _on_connect(client, _ud, _flags, _rc, _props=None, _topic=topic):  # type: ignore
-                    # Initial subscribe; retained message should arrive quickly.
-                    client.subscribe(_topic)
-
-                def _on_message(_client, _ud, msg, _received=received):  # type: ignore
-                    try:
-                        payload = json.loads(msg.payload.decode("utf-8"))
-                    except Exception:  # pragma: no cover
-                        return
-                    # Prefer top-level count when available (current schema)
-                    try:
-                        if isinstance(payload, dict):
-                            if isinstance(payload.get("count"), int):
-                                _received["count"] = int(payload["count"])
-                            else:
-                                evs = payload.get("events")
-                                if isinstance(evs, list):
-                                    _received["count"] = len(evs)
-                                else:
-                                    evj = payload.get("events_json")
-                                    if isinstance(evj, dict) and isinstance(
-                                        evj.get("count"), int
-                                    ):
-                                        _received["count"] = int(evj["count"])
-                    except Exception:
-                        pass
-                    _client.disconnect()
-
-                if CallbackAPIVersion is not None:
-                    client = mqtt.Client(
-                        protocol=mqtt.MQTTv5,
-                        callback_api_version=CallbackAPIVersion.VERSION2,
-                    )
-                else:
-                    client = mqtt.Client(protocol=mqtt.MQTTv5)
-                client.on_connect = _on_connect
-                client.on_message = _on_message
-
-                # Configure auth if provided via args or env
-                if resolved_user and resolved_pass:
-                    try:
-                        client.username_pw_set(resolved_user, resolved_pass)
-                    except Exception:
-                        pass
-
-                # Configure TLS if using TLS port or explicitly requested by env
-                _force_tls_env = os.getenv("MQTT_USE_TLS")
-                _use_tls = (
-                    resolved_port == 8883
-                    or (
-                        _force_tls_env
-                        and _force_tls_env.lower() in ("true", "1", "yes", "on")
-                    )
-                    or bool(cfg_tls_obj)
-                )
-                if _use_tls:
-                    # Default to permissive TLS unless TLS_VERIFY explicitly requests verification
-                    _tls_verify_env = os.getenv("TLS_VERIFY")
-                    verify_flag = None
-                    if _tls_verify_env is not None:
-                        try:
-                            verify_flag = _tls_verify_env.lower() in (
-                                "true",
-                                "1",
-                                "yes",
-                                "on",
-                            )
-                        except Exception:
-                            verify_flag = None
-                    try:
-                        if isinstance(cfg_tls_obj, dict):
-                            ca = cfg_tls_obj.get("ca_certs")
-                            certfile = cfg_tls_obj.get("certfile")
-                            keyfile = cfg_tls_obj.get("keyfile")
-                            if ca or certfile:
-                                client.tls_set(
-                                    ca_certs=ca, certfile=certfile, keyfile=keyfile
-                                )
-                                if verify_flag is False:
-                                    client.tls_insecure_set(True)
-                            elif verify_flag is True:
-                                client.tls_set()  # strict verification
-                            else:
-                                client.tls_set(cert_reqs=ssl.CERT_NONE)  # permissive
-                                client.tls_insecure_set(True)
-                        elif verify_flag is True:
-                            client.tls_set()
-                        else:
-                            client.tls_set(cert_reqs=ssl.CERT_NONE)
-                            client.tls_insecure_set(True)
-                    except Exception:
-                        pass
-                try:
-                    client.connect(resolved_broker, resolved_port, 30)
-                except Exception as e:  # pragma: no cover
-                    if attempt == a.mqtt_count_retries:
-                        print(f"NOTE: MQTT count connect failed final attempt: {e}")
-                        break
-                    print(
-                        f"NOTE: MQTT count connect failed attempt {attempt}/{a.mqtt_count_retries}: {e} (retrying)"
-                    )
-                    time.sleep(a.mqtt_count_retry_delay)
-                    continue
-                client.loop_start()
-                # Grace period to allow retained delivery; slightly longer for some brokers/TLS
-                time.sleep(0.25)
-                start = time.time()
-                # Increase wait window for slower brokers/TLS retained delivery
-                while (
-                    time.time() - start < 10
-                    and "count" not in received
-                    and client.is_connected()
-                ):
-                    time.sleep(0.05)
-                    # Mid-wait re-subscribe once (after ~1s) if nothing yet
-                    if 1.0 < time.time() - start < 1.1 and "count" not in received:
-                        try:
-                            client.subscribe(topic)
-                        except Exception:
-                            pass
-                client.loop_stop()
-                client.disconnect()
-                if "count" in received:
-                    mqtt_count = received["count"]
-                    break
-                if attempt < a.mqtt_count_retries:
-                    print(
-                        f"NOTE: MQTT count not received attempt {attempt}/{a.mqtt_count_retries} (retrying)"
-                    )
-                    time.sleep(a.mqtt_count_retry_delay)
-        except Exception as e:  # pragma: no cover
-            print(f"NOTE: could not retrieve MQTT all_upcoming count: {e}")
+        with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as executor:
+            for batch in (concurrent, deferred):
+                futures = [
+                    (kind, executor.submit(run_validator, kind, args))
+                    for kind, args in batch
+                ]
+                for kind, future in futures:
+                    rc, output = future.result()
+                    if output:
+                        print(output)
+                    results[kind] = rc
+                    if rc != 0 and overall_rc == 0:
+                        overall_rc = rc
+    finally:
+        sys.stdout, sys.stderr = saved_streams
+    if mqtt_error:
+        print(mqtt_error)
+        return 2
+    mqtt_ok = results.get("mqtt") == 0
 
-    # Evaluate consistency
+    # Cross-artifact consistency: ICS vs upcoming (and MQTT if ok)
+    # Independent reads (file, file, broker): wall time is the slowest of the three
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        fut_ics = executor.submit(_count_ics, a.ics) if not a.no_ics else None
+        fut_json = (
+            executor.submit(_count_json, a.upcoming) if not a.no_upcoming else None
+        )
+        fut_mqtt = executor.submit(_fetch_mqtt_count, a) if mqtt_ok else None
+        ics_count = fut_ics.result() if fut_ics else None
+        json_count = fut_json.result() if fut_json else None
+        mqtt_count = fut_mqtt.result() if fut_mqtt else None
+
+    # Evaluate consistency; counts is only built for the report line
+    vals = [v for v in (ics_count, json_count, mqtt_count) if v is not None]
+    mismatch = bool(vals) and any(v != vals[0] for v in vals[1:])
     counts = {
         k: v
-        for k, v in {"ics": ics_count, "json": json_count, "mqtt": mqtt_count}.items()
+        for k, v in (("ics", ics_count), ("json", json_count), ("mqtt", mqtt_count))
         if v is not None
     }
-    if len(set(counts.values())) > 1:
+    if mismatch:
         print(f"❌ Count mismatch detected: {counts}")
         if overall_rc == 0:
             overall_rc = 1
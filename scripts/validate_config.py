@@ -11,41 +11,54 @@ Usage:
     python scripts/validate_config.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 import sys
 
+MAX_WORKERS = 8
+
+# Validator lookup tables, built once at import rather than per call
+_IPV4_RE = re.compile(r"^\d+\.\d+\.\d+\.\d+$")
+_CONFIG_REF_RE = re.compile(rb'"?\${([^}]+)}"?')
+# KEY=VALUE lines; keys cannot start with "#" so comments never match
+_ENV_LINE_RE = re.compile(rb"(?m)^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$")
+_LOCAL_HOSTS = frozenset({"0.0.0.0", "127.0.0.1", "localhost"})
+_VALID_BOOLS = frozenset({"true", "false", "1", "0", "yes", "no", "on", "off"})
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+_VALID_SECURITY_MODES = frozenset({"none", "username", "cert", "username_cert"})
+_URL_PREFIXES = ("http://", "https://")
+
 
 def load_env_file(env_path=".env"):
     """Load environment variables from .env file."""
-    env_vars = {}
-    if Path(env_path).exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    env_vars[key.strip()] = value.strip()
-    return env_vars
+    path = Path(env_path)
+    if not path.exists():
+        return {}
+    # One regex pass over the raw bytes instead of per-line decode/strip/split
+    return {
+        key.decode(): value.decode()
+        for key, value in _ENV_LINE_RE.findall(path.read_bytes())
+    }
 
 
 def load_config_references(config_path="config/config.yaml"):
     """Load variable references from config.yaml."""
-    config_vars = {}
-    if Path(config_path).exists():
-        with open(config_path) as f:
-            content = f.read()
-            # Find all ${VARIABLE} references
-            var_refs = re.findall(r'"?\${([^}]+)}"?', content)
-            for var in var_refs:
-                config_vars[var] = True
-    return config_vars
+    path = Path(config_path)
+    if not path.exists():
+        return {}
+    # Find all ${VARIABLE} references
+    return {var.decode(): True for var in _CONFIG_REF_RE.findall(path.read_bytes())}
+
+
+def _truthy(value):
+    """Interpret a boolean env value (any accepted true spelling)."""
+    return value.strip().lower() in _BOOL_TRUE
 
 
 def validate_boolean(key, value):
     """Validate boolean environment variables."""
-    valid_bools = {"true", "false", "1", "0", "yes", "no", "on", "off"}
-    if value.lower() not in valid_bools:
+    if value.lower() not in _VALID_BOOLS:
         return f"❌ {key}={value} (should be true/false)"
     return f"✅ {key}={value}"
 
@@ -64,28 +77,51 @@ def validate_port(key, value):
 
 def validate_url(key, value):
     """Validate URL environment variables."""
-    if value.startswith(("http://", "https://")):
+    if value.startswith(_URL_PREFIXES):
         return f"✅ {key}={value} (valid URL)"
     return f"⚠️  {key}={value} (should start with http:// or https://)"
 
 
 def validate_host(key, value):
     """Validate host/IP environment variables."""
-    if value in ["0.0.0.0", "127.0.0.1", "localhost"] or re.match(
-        r"^\d+\.\d+\.\d+\.\d+$", value
-    ):
+    if value in _LOCAL_HOSTS or _IPV4_RE.match(value):
         return f"✅ {key}={value} (valid host)"
     return f"⚠️  {key}={value} (should be IP address or hostname)"
 
 
 def validate_security_mode(key, value):
     """Validate MQTT security mode."""
-    valid_modes = {"none", "username", "cert", "username_cert"}
-    if value.lower() in valid_modes:
+    if value.lower() in _VALID_SECURITY_MODES:
         return f"✅ {key}={value} (valid security mode)"
     return f"❌ {key}={value} (should be: none, username, cert, or username_cert)"
 
 
+# Validation rules: env var name -> validator, built once at import
+VALIDATORS = {
+    # Boolean variables
+    "MQTT_ENABLED": validate_boolean,
+    "HOME_ASSISTANT_ENABLED": validate_boolean,
+    "CALENDAR_ENABLED": validate_boolean,
+    "TYPE_DETECTION_ENABLED": validate_boolean,
+    "SHORTENING_ENABLED": validate_boolean,
+    "FLAGS_ENABLED": validate_boolean,
+    "WEB_SERVER_ENABLED": validate_boolean,
+    "WEB_SERVER_ACCESS_LOG": validate_boolean,
+    "WEB_SERVER_CORS_ENABLED": validate_boolean,
+    "TLS_VERIFY": validate_boolean,
+    # Port variables
+    "MQTT_BROKER_PORT": validate_port,
+    "WEB_SERVER_PORT": validate_port,
+    # URL variables
+    "WEB_SERVER_EXTERNAL_URL": validate_url,
+    # Host variables
+    "WEB_SERVER_HOST": validate_host,
+    "MQTT_BROKER_URL": validate_host,
+    # Security mode
+    "MQTT_SECURITY": validate_security_mode,
+}
+
+
 def main():
     """Main validation function."""
     print("🔍 === Twickenham Events Configuration Validator ===")
@@ -98,37 +134,21 @@ def main():
     print(f"📄 Found {len(env_vars)} variables in .env")
     print(f"📄 Found {len(config_vars)} variable references in config.yaml\n")
 
-    # Define validation rules
-    validators = {
-        # Boolean variables
-        "MQTT_ENABLED": validate_boolean,
-        "HOME_ASSISTANT_ENABLED": validate_boolean,
-        "CALENDAR_ENABLED": validate_boolean,
-        "TYPE_DETECTION_ENABLED": validate_boolean,
-        "SHORTENING_ENABLED": validate_boolean,
-        "FLAGS_ENABLED": validate_boolean,
-        "WEB_SERVER_ENABLED": validate_boolean,
-        "WEB_SERVER_ACCESS_LOG": validate_boolean,
-        "WEB_SERVER_CORS_ENABLED": validate_boolean,
-        "TLS_VERIFY": validate_boolean,
-        # Port variables
-        "MQTT_BROKER_PORT": validate_port,
-        "WEB_SERVER_PORT": validate_port,
-        # URL variables
-        "WEB_SERVER_EXTERNAL_URL": validate_url,
-        # Host variables
-        "WEB_SERVER_HOST": validate_host,
-        "MQTT_BROKER_URL": validate_host,
-        # Security mode
-        "MQTT_SECURITY": validate_security_mode,
-    }
-
     # Validate environment variables
     print("📋 === Environment Variable Validation ===")
+    # Validators run concurrently so a slow (e.g. network-probing) check does
+    # not serialise the rest; output keeps the sorted variable order.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            key: executor.submit(VALIDATORS[key], key, value)
+            for key, value in env_vars.items()
+            if key in VALIDATORS
+        }
     validation_results = []
     for key, value in sorted(env_vars.items()):
-        if key in validators:
-            result = validators[key](key, value)
+        future = futures.get(key)
+        if future is not None:
+            result = future.result()
             validation_results.append(result)
             print(f"   {result}")
         else:
@@ -146,9 +166,14 @@ def main():
 
     # Generate summary
     print("\n📊 === Summary ===")
-    error_count = len([r for r in validation_results if "❌" in r])
-    warning_count = len([r for r in validation_results if "⚠️" in r])
-    success_count = len([r for r in validation_results if "✅" in r])
+    success_count = warning_count = error_count = 0
+    for r in validation_results:
+        if "✅" in r:
+            success_count += 1
+        elif "⚠️" in r:
+            warning_count += 1
+        elif "❌" in r:
+            error_count += 1
 
     print(f"✅ {success_count} settings valid")
     print(f"⚠️  {warning_count} settings have warnings")
@@ -165,7 +190,7 @@ def main():
     print("\n💡 === Component Status ===")
 
     # Web Server Check
-    if env_vars.get("WEB_SERVER_ENABLED", "").lower() == "true":
+    if _truthy(env_vars.get("WEB_SERVER_ENABLED", "")):
         print("🌐 Web Server: ENABLED")
         required_web_vars = [
             "WEB_SERVER_HOST",
@@ -180,7 +205,7 @@ def main():
         print("🌐 Web Server: DISABLED")
 
     # MQTT Check
-    if env_vars.get("MQTT_ENABLED", "").lower() == "true":
+    if _truthy(env_vars.get("MQTT_ENABLED", "")):
         print("📡 MQTT: ENABLED")
         required_mqtt_vars = ["MQTT_BROKER_URL", "MQTT_BROKER_PORT", "MQTT_CLIENT_ID"]
         mqtt_ready = all(var in env_vars for var in required_mqtt_vars)
@@ -191,9 +216,8 @@ def main():
         print("📡 MQTT: DISABLED")
 
     # AI Processing Check
-    if (
-        env_vars.get("TYPE_DETECTION_ENABLED", "").lower() == "true"
-        or env_vars.get("SHORTENING_ENABLED", "").lower() == "true"
+    if _truthy(env_vars.get("TYPE_DETECTION_ENABLED", "")) or _truthy(
+        env_vars.get("SHORTENING_ENABLED", "")
     ):
         print("🤖 AI Processing: ENABLED")
         ai_ready = "GEMINI_API_KEY" in env_vars
@@ -14,13 +14,12 @@ from __future__ import annotations
 
 import json
 import signal
-import sys
+import threading
 import time
 
+from _cfgcache import load_cfg
 import paho.mqtt.client as mqtt
 
-from twickenham_events.config import Config
-
 
 def pretty(payload: bytes) -> str:
     txt = payload.decode("utf-8", errors="ignore").strip()
@@ -34,7 +33,7 @@ def pretty(payload: bytes) -> str:
 
 
 def main() -> int:
-    cfg = Config.from_file("config/config.yaml")
+    cfg = load_cfg("config/config.yaml")
     base = cfg.get("app.unique_id_prefix", "twickenham_events")
 
     broker = cfg.mqtt_broker
@@ -76,17 +75,18 @@ def main() -> int:
     client.on_connect = on_connect
     client.on_message = on_message
 
-    # Graceful exit on Ctrl+C
-    def _sigint(*_):
-        try:
-            client.disconnect()
-        finally:
-            sys.exit(0)
-
-    signal.signal(signal.SIGINT, _sigint)
+    # Network loop runs on paho's thread; the main thread just waits for
+    # Ctrl+C so shutdown is a single, orderly disconnect.
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
 
-    client.connect(broker, port, keepalive=60)
-    client.loop_forever()
+    client.connect_async(broker, port, keepalive=60)
+    client.loop_start()
+    try:
+        stop.wait()
+    finally:
+        client.disconnect()
+        client.loop_stop()
     return 0
 
 
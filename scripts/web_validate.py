@@ -7,8 +7,12 @@ Similar to mqtt_validate.py but for the FastAPI web server.
 """
 
 import argparse
+import asyncio
+from functools import lru_cache
+import importlib.util
 import json
 from pathlib import Path
+import re
 import sys
 import time
 from typing import Any
@@ -21,6 +25,25 @@ except ImportError:
     httpx = None  # type: ignore[assignment]
     WEB_VALIDATION_AVAILABLE = False
 
+# httpx only speaks HTTP/2 with the optional h2 package (httpx[http2]);
+# requesting it without h2 raises, so enable it only when importable
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:  # optional: faster event loop for the concurrent probe fallback
+    import uvloop  # type: ignore[import-not-found]
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+try:  # optional: one-pass multi-needle search for "contains" checks
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
+
+try:  # optional: compiled required-field checks; the dict walk is the fallback
+    import fastjsonschema  # type: ignore[import-not-found]
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -29,9 +52,26 @@ try:
 except ImportError:
     Config = None  # type: ignore
 
+# Endpoints probed when --endpoints is not given; a tuple so the cached
+# parser's default can never be mutated between main() calls
+_DEFAULT_ENDPOINTS: tuple[str, ...] = (
+    "/",
+    "/health",
+    "/status",
+    "/files",
+    "/events",
+    "/calendar",
+    "/docs",
+)
 
+
+@lru_cache(maxsize=1)
 def parse_args() -> argparse.ArgumentParser:
-    """Parse command line arguments."""
+    """Parse command line arguments.
+
+    The parser is built once and reused by repeated main() calls, so its
+    defaults must be immutable.
+    """
     p = argparse.ArgumentParser(description="Validate Twickenham Events web server")
     p.add_argument("--host", default="localhost", help="Web server host to test")
     p.add_argument("--port", type=int, default=8080, help="Web server port to test")
@@ -47,15 +87,7 @@ def parse_args() -> argparse.ArgumentParser:
     p.add_argument(
         "--endpoints",
         nargs="*",
-        default=[
-            "/",
-            "/health",
-            "/status",
-            "/files",
-            "/events",
-            "/calendar",
-            "/docs",
-        ],
+        default=_DEFAULT_ENDPOINTS,
         help="Endpoints to validate",
     )
     p.add_argument(
@@ -63,6 +95,14 @@ def parse_args() -> argparse.ArgumentParser:
         action="store_true",
         help="Validate that expected output files are served correctly",
     )
+    p.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Probe all endpoints in one POST /batch when the server enables it "
+            "(web_server.batch_enabled); checks the app, not the proxy path"
+        ),
+    )
     p.add_argument(
         "--external-url",
         help="External URL base to test (overrides host:port, useful for Docker/proxy)",
@@ -70,6 +110,108 @@ def parse_args() -> argparse.ArgumentParser:
     return p
 
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=128)
+def _field_path(field: str) -> tuple[str, ...]:
+    """Split a dotted required-field name once per distinct field."""
+    return tuple(field.split("."))
+
+
+def _get_path(data: Any, path: tuple[str, ...]) -> Any:
+    """Walk nested dicts along path; _MISSING if any key is absent."""
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return _MISSING
+        data = data[key]
+    return data
+
+
+def _required_fields_schema(fields: tuple[str, ...]) -> dict[str, Any]:
+    """JSON Schema requiring every (possibly dotted) field, objects all the way."""
+    clauses = []
+    for field in fields:
+        # The leaf value may be anything; every level above it must be an object
+        schema: dict[str, Any] = {}
+        for key in reversed(_field_path(field)):
+            schema = {"type": "object", "required": [key], "properties": {key: schema}}
+        clauses.append(schema)
+    return {"allOf": clauses}
+
+
+@lru_cache(maxsize=32)
+def _required_fields_validator(fields: tuple[str, ...]) -> Any | None:
+    """Compiled validator for a required_fields list, built once per list."""
+    if fastjsonschema is None or not fields:
+        return None
+    return fastjsonschema.compile(_required_fields_schema(fields))
+
+
+@lru_cache(maxsize=32)
+def _needle_automaton(needles: frozenset[str]) -> Any | None:
+    """Aho-Corasick automaton over the needles, built once per needle set."""
+    if ahocorasick is None or len(needles) < 2:
+        return None
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+def _missing_texts(text: str, required: list[str]) -> list[str]:
+    """Required strings absent from text, in their original order."""
+    automaton = _needle_automaton(frozenset(required))
+    if automaton is None:
+        return [needle for needle in required if needle not in text]
+    # One scan over the body for every needle, stopping once all are seen
+    wanted = len(automaton)
+    hits: set[str] = set()
+    for _, found in automaton.iter(text):
+        hits.add(found)
+        if len(hits) == wanted:
+            break
+    return [needle for needle in required if needle not in hits]
+
+
+# Host names / IPv4 addresses accepted by validate_config
+_HOST_RE = re.compile(r"[A-Za-z0-9._-]+")
+_LOCAL_HOSTS = frozenset({"0.0.0.0", "127.0.0.1", "localhost"})
+
+# Status-only fallback when HEAD is rejected: ask for a single body byte
+RANGE_PROBE_HEADERS = {"Range": "bytes=0-0"}
+
+# (endpoint, content_checks) pairs probed by the grouped validations
+Probe = tuple[str, dict[str, Any] | None]
+
+HEALTH_PROBES: list[Probe] = [
+    # Health endpoint
+    ("/health", {"json": True, "required_fields": ["status", "timestamp"]}),
+    # Status endpoint (more detailed)
+    (
+        "/status",
+        {"json": True, "required_fields": ["service", "timestamp", "files"]},
+    ),
+]
+
+API_DOCS_PROBES: list[Probe] = [
+    # OpenAPI/Swagger docs
+    ("/docs", {"contains": ["Swagger UI", "API"]}),
+    # OpenAPI JSON schema
+    ("/openapi.json", {"json": True, "required_fields": ["openapi", "info", "paths"]}),
+]
+
+CALENDAR_PROBE: Probe = (
+    "/calendar",
+    {"contains": ["BEGIN:VCALENDAR", "END:VCALENDAR"]},
+)
+EVENTS_PROBE: Probe = (
+    "/events",
+    {"json": True, "required_fields": ["last_updated", "events"]},
+)
+
+
 class WebServerValidator:
     """Web server validation helper."""
 
@@ -84,6 +226,189 @@ class WebServerValidator:
         self.config = config
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        # None until the first status-only probe learns whether HEAD is
+        # accepted; False after a 405 so later probes skip straight to GET
+        self._head_ok: bool | None = None
+        # Concurrent probes wait here until that first HEAD has answered
+        self._head_lock = asyncio.Lock()
+        # ETag of each content-checked URL whose body last passed its checks;
+        # a repeat probe sends If-None-Match and a 304 skips the re-download
+        self._etag_cache: dict[str, str] = {}
+        # One pooled client for every probe so keep-alive connections are reused
+        # (and, over TLS with h2 installed, multiplexed as HTTP/2 streams)
+        self._client = (
+            httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            if httpx is not None
+            else None
+        )
+
+    def __enter__(self) -> "WebServerValidator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            self._client.close()
+
+    def _check_response(
+        self,
+        endpoint: str,
+        response: Any,
+        expected_status: int,
+        content_checks: dict[str, Any] | None,
+        errors: list[str],
+    ) -> bool:
+        """Apply status and content checks to an httpx response."""
+        status = response.status_code
+        # A ranged status-only probe gets 206 where a full GET would get 200,
+        # or 416 when the body is empty (e.g. an ICS file with no events)
+        if status in (206, 416) and "range" in response.request.headers:
+            status = 200
+        # Unchanged since the body last passed these checks; nothing to rescan
+        if status == 304 and "if-none-match" in response.request.headers:
+            return True
+        # Only touch the body when a content check needs it
+        return self._apply_checks(
+            endpoint,
+            status,
+            response.headers,
+            response.text if content_checks else "",
+            expected_status,
+            content_checks,
+            errors,
+        )
+
+    def _apply_checks(
+        self,
+        endpoint: str,
+        status: int,
+        headers: Any,
+        body: str,
+        expected_status: int,
+        content_checks: dict[str, Any] | None,
+        errors: list[str],
+    ) -> bool:
+        """Apply status and content checks, appending failures to errors.
+
+        headers only needs a .get(); both httpx headers and the lower-cased
+        dicts returned by POST /batch qualify.
+        """
+        # Check status code
+        if status != expected_status:
+            errors.append(
+                f"{endpoint}: Expected status {expected_status}, got {status}"
+            )
+            return False
+
+        # Check content if specified
+        if content_checks:
+            content_type = headers.get("content-type", "").lower()
+
+            # JSON content validation
+            if content_checks.get("json") and "application/json" in content_type:
+                try:
+                    # Parsed once; every field path below walks this document
+                    data = json.loads(body)
+                except json.JSONDecodeError:
+                    errors.append(f"{endpoint}: Invalid JSON response")
+                    return False
+                fields = tuple(content_checks.get("required_fields", ()))
+                validate = _required_fields_validator(fields)
+                if validate is not None:
+                    try:
+                        validate(data)
+                        fields = ()  # every field present
+                    except fastjsonschema.JsonSchemaException:
+                        pass  # the walk below names the first missing field
+                for field in fields:
+                    # Nested fields use dotted paths (e.g., "status.healthy")
+                    if _get_path(data, _field_path(field)) is _MISSING:
+                        errors.append(f"{endpoint}: Missing required field '{field}'")
+                        return False
+
+            # Text content validation
+            if content_checks.get("contains"):
+                missing = _missing_texts(body, content_checks["contains"])
+                if missing:
+                    errors.append(
+                        f"{endpoint}: Response missing required text: '{missing[0]}'"
+                    )
+                    return False
+
+        return True
+
+    def _request_error(self, endpoint: str, url: str, e: Exception) -> str:
+        """Describe a failed request."""
+        # Handle httpx-specific errors without referencing possibly-unavailable types
+        if httpx is not None and isinstance(e, httpx.TimeoutException):
+            return f"{endpoint}: Request timeout after {self.timeout}s"
+        if httpx is not None and isinstance(e, httpx.ConnectError):
+            return f"{endpoint}: Connection failed to {url}"
+        return f"{endpoint}: Unexpected error: {e}"
+
+    def _probe(self, url: str, content_checks: dict[str, Any] | None) -> Any:
+        """GET when the body is checked; otherwise HEAD, or a 1-byte ranged GET."""
+        assert (
+            self._client is not None
+        )  # For type checkers; guarded by WEB_VALIDATION_AVAILABLE
+        if content_checks:
+            return self._client.get(url, headers=self._conditional_headers(url))
+        if self._head_ok is not False:
+            response = self._client.head(url)
+            if not self._head_rejected(response):
+                return response
+        return self._client.get(url, headers=RANGE_PROBE_HEADERS)
+
+    def _head_rejected(self, response: Any) -> bool:
+        """Record whether the server answers HEAD; True on a 405."""
+        # Server rejects HEAD (FastAPI GET routes do); skip it from now on
+        self._head_ok = response.status_code != 405
+        return not self._head_ok
+
+    def _conditional_headers(self, url: str) -> dict[str, str] | None:
+        etag = self._etag_cache.get(url)
+        return {"If-None-Match": etag} if etag else None
+
+    def _remember_etag(self, url: str, response: Any) -> None:
+        """Cache the ETag of a content-checked GET whose checks passed."""
+        if response.status_code == 200:
+            etag = response.headers.get("etag")
+            if etag:
+                self._etag_cache[url] = etag
+
+    async def _probe_async(
+        self, client: Any, url: str, content_checks: dict[str, Any] | None
+    ) -> Any:
+        """Async twin of _probe.
+
+        Until the first HEAD has answered, status-only probes take turns, so
+        a server that rejects HEAD costs one 405 per run rather than one per
+        concurrent probe.
+        """
+        if content_checks:
+            return await client.get(url, headers=self._conditional_headers(url))
+        if self._head_ok is None:
+            async with self._head_lock:
+                if self._head_ok is None:
+                    response = await client.head(url)
+                    if not self._head_rejected(response):
+                        return response
+        if self._head_ok:
+            response = await client.head(url)
+            if not self._head_rejected(response):
+                return response
+        return await client.get(url, headers=RANGE_PROBE_HEADERS)
 
     def validate_endpoint(
         self,
@@ -92,155 +417,189 @@ class WebServerValidator:
         content_checks: dict[str, Any] | None = None,
     ) -> bool:
         """Validate a single endpoint."""
+        errors: list[str] = []
+        ok = self._check_endpoint(endpoint, expected_status, content_checks, errors)
+        self.errors.extend(errors)
+        return ok
+
+    def _check_endpoint(
+        self,
+        endpoint: str,
+        expected_status: int,
+        content_checks: dict[str, Any] | None,
+        errors: list[str],
+    ) -> bool:
+        """Probe one endpoint, appending any failures to the caller's list."""
         url = f"{self.base_url}{endpoint}"
 
         try:
-            assert (
-                httpx is not None
-            )  # For type checkers; guarded by WEB_VALIDATION_AVAILABLE
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url)
-
-                # Check status code
-                if response.status_code != expected_status:
-                    self.errors.append(
-                        f"{endpoint}: Expected status {expected_status}, got {response.status_code}"
-                    )
-                    return False
+            response = self._probe(url, content_checks)
+        except Exception as e:
+            errors.append(self._request_error(endpoint, url, e))
+            return False
 
-                # Check content if specified
-                if content_checks:
-                    content_type = response.headers.get("content-type", "").lower()
-
-                    # JSON content validation
-                    if (
-                        content_checks.get("json")
-                        and "application/json" in content_type
-                    ):
-                        try:
-                            data = response.json()
-                            required_fields = content_checks.get("required_fields", [])
-                            for field in required_fields:
-                                if "." in field:
-                                    # Nested field check (e.g., "status.healthy")
-                                    keys = field.split(".")
-                                    value = data
-                                    for key in keys:
-                                        if isinstance(value, dict) and key in value:
-                                            value = value[key]
-                                        else:
-                                            self.errors.append(
-                                                f"{endpoint}: Missing required field '{field}'"
-                                            )
-                                            return False
-                                elif field not in data:
-                                    # Simple field check
-                                    self.errors.append(
-                                        f"{endpoint}: Missing required field '{field}'"
-                                    )
-                                    return False
-                        except json.JSONDecodeError:
-                            self.errors.append(f"{endpoint}: Invalid JSON response")
-                            return False
-
-                    # Text content validation
-                    if content_checks.get("contains"):
-                        text = response.text
-                        for required_text in content_checks["contains"]:
-                            if required_text not in text:
-                                self.errors.append(
-                                    f"{endpoint}: Response missing required text: '{required_text}'"
-                                )
-                                return False
-
-                print(f"✅ {endpoint}: OK ({response.status_code})")
-                return True
+        if not self._check_response(
+            endpoint, response, expected_status, content_checks, errors
+        ):
+            return False
+        if content_checks:
+            self._remember_etag(url, response)
+        print(f"✅ {endpoint}: OK ({response.status_code})")
+        return True
 
+    async def _validate_endpoint_async(
+        self,
+        client: Any,
+        endpoint: str,
+        expected_status: int = 200,
+        content_checks: dict[str, Any] | None = None,
+    ) -> tuple[bool, int | None, list[str]]:
+        """Async twin of validate_endpoint.
+
+        Returns (ok, status_code, errors) instead of touching shared state, so
+        concurrent probes never interleave their errors or output.
+        """
+        url = f"{self.base_url}{endpoint}"
+        errors: list[str] = []
+        try:
+            response = await self._probe_async(client, url, content_checks)
         except Exception as e:
-            # Handle httpx-specific errors without referencing possibly-unavailable types
-            if httpx is not None and isinstance(e, httpx.TimeoutException):
-                self.errors.append(f"{endpoint}: Request timeout after {self.timeout}s")
-                return False
-            if httpx is not None and isinstance(e, httpx.ConnectError):
-                self.errors.append(f"{endpoint}: Connection failed to {url}")
-                return False
-            self.errors.append(f"{endpoint}: Unexpected error: {e}")
-            return False
+            errors.append(self._request_error(endpoint, url, e))
+            return False, None, errors
+        ok = self._check_response(
+            endpoint, response, expected_status, content_checks, errors
+        )
+        if ok and content_checks:
+            self._remember_etag(url, response)
+        return ok, response.status_code, errors
 
-    def validate_file_serving(self) -> bool:
-        """Validate that expected output files are properly served."""
+    def file_serving_probes(self) -> list[Probe]:
+        """Probes for the served output files (empty without a config)."""
         if not self.config:
             self.warnings.append("No config provided, skipping file validation")
-            return True
+            return []
+        probes = [CALENDAR_PROBE] if self.config.calendar_enabled else []
+        probes.append(EVENTS_PROBE)
+        return probes
+
+    def _validate_probes(self, probes: list[Probe]) -> bool:
+        # Evaluate every probe; a failure must not skip the ones after it.
+        # Failures collect locally and land in self.errors in one extend.
+        errors: list[str] = []
+        results = [
+            self._check_endpoint(endpoint, 200, checks, errors)
+            for endpoint, checks in probes
+        ]
+        self.errors.extend(errors)
+        return all(results)
 
-        success = True
-
-        # Check calendar file
-        if self.config.calendar_enabled:
-            calendar_endpoint = "/calendar"
-            if not self.validate_endpoint(
-                calendar_endpoint,
-                content_checks={"contains": ["BEGIN:VCALENDAR", "END:VCALENDAR"]},
-            ):
-                success = False
-
-        # Check events JSON
-        events_endpoint = "/events"
-        if not self.validate_endpoint(
-            events_endpoint,
-            content_checks={
-                "json": True,
-                "required_fields": ["last_updated", "events"],
-            },
-        ):
-            success = False
-
-        return success
+    def validate_file_serving(self) -> bool:
+        """Validate that expected output files are properly served."""
+        return self._validate_probes(self.file_serving_probes())
 
     def validate_health_status(self) -> bool:
         """Validate health and status endpoints."""
-        success = True
-
-        # Health endpoint
-        if not self.validate_endpoint(
-            "/health",
-            content_checks={"json": True, "required_fields": ["status", "timestamp"]},
-        ):
-            success = False
-
-        # Status endpoint (more detailed)
-        if not self.validate_endpoint(
-            "/status",
-            content_checks={
-                "json": True,
-                "required_fields": ["service", "timestamp", "files"],
-            },
-        ):
-            success = False
-
-        return success
+        return self._validate_probes(HEALTH_PROBES)
 
     def validate_api_docs(self) -> bool:
         """Validate API documentation endpoints."""
-        success = True
-
-        # OpenAPI/Swagger docs
-        if not self.validate_endpoint(
-            "/docs", content_checks={"contains": ["Swagger UI", "API"]}
-        ):
-            success = False
-
-        # OpenAPI JSON schema
-        if not self.validate_endpoint(
-            "/openapi.json",
-            content_checks={
-                "json": True,
-                "required_fields": ["openapi", "info", "paths"],
-            },
-        ):
-            success = False
+        return self._validate_probes(API_DOCS_PROBES)
+
+    async def run_all(self, sections: list[tuple[str, list[Probe]]]) -> bool:
+        """Probe every endpoint of every section concurrently.
+
+        All requests go out together over one pooled AsyncClient; results are
+        then reported section by section in the original order.
+        """
+        assert httpx is not None  # guarded by WEB_VALIDATION_AVAILABLE
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ) as client:
+            results = await asyncio.gather(
+                *(
+                    self._validate_endpoint_async(
+                        client, endpoint, content_checks=checks
+                    )
+                    for _, probes in sections
+                    for endpoint, checks in probes
+                )
+            )
+
+        return self._report_sections(sections, results)
+
+    def validate_batch(self, sections: list[tuple[str, list[Probe]]]) -> bool | None:
+        """Probe every endpoint with a single POST /batch request.
+
+        Returns None when the server has no batch endpoint (404/405) or the
+        request itself fails, so the caller can fall back to run_all.
+        """
+        assert self._client is not None  # guarded by WEB_VALIDATION_AVAILABLE
+        probes = [probe for _, section_probes in sections for probe in section_probes]
+        if not probes:
+            return self._report_sections(sections, [])
+        try:
+            response = self._client.post(
+                f"{self.base_url}/batch",
+                json={
+                    "requests": [
+                        # HEAD: the server runs the GET but returns no body
+                        {"method": "GET" if checks else "HEAD", "path": endpoint}
+                        for endpoint, checks in probes
+                    ]
+                },
+            )
+        except Exception:
+            return None
+        if response.status_code in (404, 405):
+            return None
+        try:
+            sub_responses = response.json()["responses"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            sub_responses = None
+        if response.status_code != 200 or not isinstance(sub_responses, list):
+            return None
+        if len(sub_responses) != len(probes):
+            return None
 
-        return success
+        results = []
+        for (endpoint, checks), sub in zip(probes, sub_responses, strict=True):
+            errors: list[str] = []
+            ok = self._apply_checks(
+                endpoint,
+                sub.get("status"),
+                sub.get("headers") or {},
+                sub.get("body") or "",
+                200,
+                checks,
+                errors,
+            )
+            results.append((ok, sub.get("status"), errors))
+        return self._report_sections(sections, results)
+
+    def _report_sections(
+        self,
+        sections: list[tuple[str, list[Probe]]],
+        results: list[tuple[bool, int | None, list[str]]],
+    ) -> bool:
+        """Print per-section results in probe order and merge their errors."""
+        all_success = True
+        offset = 0
+        for title, probes in sections:
+            print(title)
+            section_results = results[offset : offset + len(probes)]
+            offset += len(probes)
+            for (endpoint, _), (ok, status, errors) in zip(
+                probes, section_results, strict=True
+            ):
+                # Merge once probes finish: only this thread touches self.errors
+                self.errors.extend(errors)
+                if ok:
+                    print(f"✅ {endpoint}: OK ({status})")
+                else:
+                    all_success = False
+        return all_success
 
 
 def validate_config(config: Any) -> bool:
@@ -255,10 +614,7 @@ def validate_config(config: Any) -> bool:
     host = config.web_host
     if not host:
         errors.append("web_server.host is required")
-    elif (
-        host not in ["0.0.0.0", "127.0.0.1", "localhost"]
-        and not host.replace(".", "").replace("-", "").replace("_", "").isalnum()
-    ):
+    elif host not in _LOCAL_HOSTS and not _HOST_RE.fullmatch(host):
         errors.append(f"web_server.host '{host}' appears invalid")
 
     # Validate port
@@ -352,47 +708,49 @@ def main(argv: list[str]) -> int:
             return 1
 
     try:
-        # Create validator
-        validator = WebServerValidator(base_url, args.timeout, config)
-
-        # Run validations
-        all_success = True
-
-        print("\n🔍 Validating endpoints...")
-        for endpoint in args.endpoints:
-            if not validator.validate_endpoint(endpoint):
-                all_success = False
-
-        print("\n🏥 Validating health endpoints...")
-        if not validator.validate_health_status():
-            all_success = False
-
-        print("\n📚 Validating API documentation...")
-        if not validator.validate_api_docs():
-            all_success = False
-
-        if args.check_files:
-            print("\n📁 Validating file serving...")
-            if not validator.validate_file_serving():
-                all_success = False
-
-        # Report results
-        if validator.warnings:
-            print("\n⚠️  Warnings:")
-            for warning in validator.warnings:
-                print(f"  - {warning}")
-
-        if validator.errors:
-            print("\n❌ Validation errors:")
-            for error in validator.errors:
-                print(f"  - {error}")
-
-        if all_success and not validator.errors:
-            print("\n✅ All web server validations passed!")
-            return 0
-        else:
-            print("\n❌ Web server validation failed")
-            return 1
+        # Create validator; closing it releases the pooled connections
+        with WebServerValidator(base_url, args.timeout, config) as validator:
+            # Run validations
+            sections: list[tuple[str, list[Probe]]] = [
+                (
+                    "\n🔍 Validating endpoints...",
+                    [(endpoint, None) for endpoint in args.endpoints],
+                ),
+                ("\n🏥 Validating health endpoints...", HEALTH_PROBES),
+                ("\n📚 Validating API documentation...", API_DOCS_PROBES),
+            ]
+            if args.check_files:
+                sections.append(
+                    ("\n📁 Validating file serving...", validator.file_serving_probes())
+                )
+            # Per-endpoint probes exercise each URL through any proxy; the
+            # in-process POST /batch round trip is opt-in and falls back to
+            # them when the server does not offer it
+            all_success = validator.validate_batch(sections) if args.batch else None
+            if all_success is None:
+                # uvloop via loop_factory keeps the global loop policy untouched
+                # for callers that run main() in-process
+                loop_factory = uvloop.new_event_loop if uvloop is not None else None
+                with asyncio.Runner(loop_factory=loop_factory) as runner:
+                    all_success = runner.run(validator.run_all(sections))
+
+            # Report results
+            if validator.warnings:
+                print("\n⚠️  Warnings:")
+                for warning in validator.warnings:
+                    print(f"  - {warning}")
+
+            if validator.errors:
+                print("\n❌ Validation errors:")
+                for error in validator.errors:
+                    print(f"  - {error}")
+
+            if all_success and not validator.errors:
+                print("\n✅ All web server validations passed!")
+                return 0
+            else:
+                print("\n❌ Web server validation failed")
+                return 1
 
     finally:
         # Stop test server if we started it
@@ -5,47 +5,104 @@ Twickenham Events CLI - Modern command-line interface.
 Complete restoration of CLI functionality with modern architecture.
 """
 
+from __future__ import annotations
+
 import argparse
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
+import importlib
 import json
 import logging
 import os
 from pathlib import Path
-import signal
-import ssl
 import sys
-import threading
 import time
-from typing import Any
-
-# Import ha_mqtt_publisher from PyPI package
-try:
-    from ha_mqtt_publisher import HealthTracker
-    from ha_mqtt_publisher.publisher import MQTTPublisher as LibMQTTPublisher
-except Exception:
-    # Provide a lightweight stub that fails clearly if the dependency isn't available.
-    class LibMQTTPublisher:  # type: ignore[no-redef]
-        def __init__(self, *a, **kw):
-            raise RuntimeError(
-                "ha_mqtt_publisher not available. Install it with: pip install ha-mqtt-publisher"
-            )
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+if TYPE_CHECKING:
+    from .config import Config
 
-import paho.mqtt.client as mqtt
 
-from .ai_processor import AIProcessor
-from .calendar_generator import CalendarGenerator
-from .config import Config
-from .enhanced_discovery import (
-    publish_enhanced_device_discovery as publish_device_level_discovery,
+# ANSI styles for terminal output, computed once at import and left empty
+# when stdout is not a terminal or NO_COLOR is set
+_USE_COLOR = (
+    sys.stdout is not None and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
 )
-from .mqtt_client import MQTTClient
-from .scraper import EventScraper
-from .service_support import AvailabilityPublisher, install_global_signal_handler
+BOLD = "\033[1m" if _USE_COLOR else ""
+RED = "\033[31m" if _USE_COLOR else ""
+GREEN = "\033[32m" if _USE_COLOR else ""
+YELLOW = "\033[33m" if _USE_COLOR else ""
+BLUE_BRIGHT = "\033[94m" if _USE_COLOR else ""
+CYAN_BRIGHT = "\033[96m" if _USE_COLOR else ""
+RESET = "\033[0m" if _USE_COLOR else ""
+
+# Environment flag values read as true (MQTT_USE_TLS, TLS_VERIFY)
+_TRUE_STRS = frozenset({"true", "1", "yes", "on"})
+
+
+class _MissingLibMQTTPublisher:
+    """Lightweight stub that fails clearly if ha_mqtt_publisher isn't available."""
+
+    def __init__(self, *a, **kw):
+        raise RuntimeError(
+            "ha_mqtt_publisher not available. Install it with: pip install ha-mqtt-publisher"
+        )
+
+
+# Backends are imported on first use rather than at module load, so that
+# `--help`, `--version` and argument errors never pull in requests, bs4,
+# icalendar, paho-mqtt or the AI SDKs. Name -> (module, attribute); an empty
+# attribute binds the module itself.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "AIProcessor": (".ai_processor", "AIProcessor"),
+    "AvailabilityPublisher": (".service_support", "AvailabilityPublisher"),
+    "CalendarGenerator": (".calendar_generator", "CalendarGenerator"),
+    "Config": (".config", "Config"),
+    "EventScraper": (".scraper", "EventScraper"),
+    "HealthTracker": ("ha_mqtt_publisher", "HealthTracker"),
+    "LibMQTTPublisher": ("ha_mqtt_publisher.publisher", "MQTTPublisher"),
+    "MQTTClient": (".mqtt_client", "MQTTClient"),
+    "install_global_signal_handler": (
+        ".service_support",
+        "install_global_signal_handler",
+    ),
+    "mqtt": ("paho.mqtt.client", ""),
+    "publish_device_level_discovery": (
+        ".enhanced_discovery",
+        "publish_enhanced_device_discovery",
+    ),
+}
+# Stand-ins used when an optional import fails
+_LAZY_FALLBACKS: dict[str, Any] = {"LibMQTTPublisher": _MissingLibMQTTPublisher}
+
+
+def _lazy(name: str) -> Any:
+    """Resolve a deferred import, caching it as a module global.
+
+    Names already present (e.g. patched by a test) are returned untouched.
+    """
+    g = globals()
+    if name not in g:
+        module_name, attr = _LAZY_IMPORTS[name]
+        try:
+            module = importlib.import_module(module_name, __package__)
+            g[name] = getattr(module, attr) if attr else module
+        except Exception:
+            if name not in _LAZY_FALLBACKS:
+                raise
+            g[name] = _LAZY_FALLBACKS[name]
+    return g[name]
+
 
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser with all CLI commands."""
+
+def _build_root_parser() -> argparse.ArgumentParser:
+    """Create the top-level parser with the global options."""
     parser = argparse.ArgumentParser(
         prog="twick-events",
         description="Twickenham Events: Rugby event processing with MQTT and calendar integration",
@@ -75,166 +132,292 @@ Examples:
     )
     parser.add_argument("--output", type=str, help="custom output directory")
     parser.add_argument("--debug", action="store_true", help="enable debug output")
+    parser.add_argument(
+        "--quiet", action="store_true", help="only log warnings and errors"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="test mode - no data will be saved or published",
     )
+    return parser
 
-    subparsers = parser.add_subparsers(
-        dest="command", help="available commands", required=False
-    )
 
-    # Scrape command
-    scrape_parser = subparsers.add_parser(
-        "scrape", help="scrape events and save to output directory"
-    )
-    scrape_parser.add_argument(
-        "--output",
-        help="output directory for results (files will be created within this directory)",
-    )
+# (flags, add_argument keyword arguments)
+_ArgSpec = tuple[tuple[str, ...], dict[str, Any]]
 
-    # MQTT command
-    mqtt_parser = subparsers.add_parser(
-        "mqtt", help="scrape events and publish to MQTT"
-    )
-    mqtt_parser.add_argument(
-        "--output",
-        help="output directory for results (files will be created within this directory)",
-    )
 
-    # Calendar command
-    calendar_parser = subparsers.add_parser(
-        "calendar", help="scrape events and generate calendar"
-    )
-    calendar_parser.add_argument(
-        "--output",
-        help="output directory for results (files will be created within this directory)",
-    )
+class _CommandSpec(NamedTuple):
+    """Declarative description of one (sub)command for create_parser."""
 
-    # All command (default behavior)
-    all_parser = subparsers.add_parser(
-        "all", help="run all integrations (scrape + MQTT + calendar)"
-    )
-    all_parser.add_argument(
-        "--output",
-        help="output directory for results (files will be created within this directory)",
-    )
+    help: str
+    args: tuple[_ArgSpec, ...] = ()
+    # Nested command group: (dest, help, {name: spec})
+    group: tuple[str, str, dict[str, _CommandSpec]] | None = None
 
-    # List command - show all upcoming events
-    list_parser = subparsers.add_parser(
-        "list", help="list all upcoming events in a readable format"
-    )
-    list_parser.add_argument(
-        "--limit", type=int, default=None, help="maximum number of events to show"
-    )
-    list_parser.add_argument(
-        "--format",
-        choices=["detailed", "simple", "json"],
-        default="detailed",
-        help="output format: detailed (default), simple, or json",
-    )
-    list_parser.add_argument(
-        "--output",
-        help="output directory for results (files will be created within this directory)",
-    )
 
+_OUTPUT_ARG: _ArgSpec = (
+    ("--output",),
+    {
+        "help": "output directory for results (files will be created within this directory)"
+    },
+)
+
+# Subcommands in help order; built once at import, only read by create_parser
+_SUBCOMMANDS: dict[str, _CommandSpec] = {
+    "scrape": _CommandSpec(
+        "scrape events and save to output directory", (_OUTPUT_ARG,)
+    ),
+    "mqtt": _CommandSpec("scrape events and publish to MQTT", (_OUTPUT_ARG,)),
+    "calendar": _CommandSpec("scrape events and generate calendar", (_OUTPUT_ARG,)),
+    # All command (default behavior)
+    "all": _CommandSpec(
+        "run all integrations (scrape + MQTT + calendar)", (_OUTPUT_ARG,)
+    ),
+    # List command - show all upcoming events
+    "list": _CommandSpec(
+        "list all upcoming events in a readable format",
+        (
+            (
+                ("--limit",),
+                {
+                    "type": int,
+                    "default": None,
+                    "help": "maximum number of events to show",
+                },
+            ),
+            (
+                ("--format",),
+                {
+                    "choices": ("detailed", "simple", "json"),
+                    "default": "detailed",
+                    "help": "output format: detailed (default), simple, or json",
+                },
+            ),
+            _OUTPUT_ARG,
+        ),
+    ),
     # Next command - show only the next upcoming event
-    next_parser = subparsers.add_parser(
-        "next", help="show only the next upcoming event"
-    )
-    next_parser.add_argument(
-        "--output",
-        help="output directory for results (files will be created within this directory)",
-    )
+    "next": _CommandSpec("show only the next upcoming event", (_OUTPUT_ARG,)),
+    "status": _CommandSpec("show configuration and system status"),
+    # Service (daemon) command
+    "service": _CommandSpec(
+        "run continuous service (periodic scrape + MQTT)",
+        (
+            (
+                ("--once",),
+                {"action": "store_true", "help": "run a single cycle then exit"},
+            ),
+            (
+                ("--interval",),
+                {"type": int, "help": "override scrape interval seconds"},
+            ),
+            (
+                ("--cleanup-discovery",),
+                {
+                    "action": "store_true",
+                    "help": "cleanup legacy/duplicate discovery entities and exit",
+                },
+            ),
+        ),
+    ),
+    # Cache command group
+    "cache": _CommandSpec(
+        "manage AI shortening cache",
+        group=(
+            "cache_command",
+            "cache operations",
+            {
+                "clear": _CommandSpec("clear AI shortening cache"),
+                "stats": _CommandSpec("show cache statistics"),
+                "reprocess": _CommandSpec(
+                    "reprocess cached items with current configuration"
+                ),
+            },
+        ),
+    ),
+    # Validate command group
+    "validate": _CommandSpec(
+        "validate system components",
+        group=(
+            "validate_command",
+            "validation operations",
+            {
+                # Web server validation
+                "web": _CommandSpec(
+                    "validate web server configuration and connectivity",
+                    (
+                        (
+                            ("--host",),
+                            {"help": "web server host to test (overrides config)"},
+                        ),
+                        (
+                            ("--port",),
+                            {
+                                "type": int,
+                                "help": "web server port to test (overrides config)",
+                            },
+                        ),
+                        (
+                            ("--timeout",),
+                            {
+                                "type": float,
+                                "default": 10.0,
+                                "help": "request timeout in seconds",
+                            },
+                        ),
+                        (
+                            ("--start-server",),
+                            {
+                                "action": "store_true",
+                                "help": "start the web server before validation (for testing)",
+                            },
+                        ),
+                        (
+                            ("--check-files",),
+                            {
+                                "action": "store_true",
+                                "help": "validate that expected output files are served correctly",
+                            },
+                        ),
+                        (
+                            ("--external-url",),
+                            {
+                                "help": "external URL base to test (overrides host:port, useful for Docker/proxy)"
+                            },
+                        ),
+                    ),
+                ),
+                # Config validation
+                "config": _CommandSpec(
+                    "validate configuration file and environment variables",
+                    (
+                        (
+                            ("--strict",),
+                            {
+                                "action": "store_true",
+                                "help": "enable strict validation mode",
+                            },
+                        ),
+                    ),
+                ),
+            },
+        ),
+    ),
+    # Commands (registry) introspection
+    "commands": _CommandSpec(
+        "print supported command registry (discovery metadata)",
+        (
+            (
+                ("--json",),
+                {
+                    "action": "store_true",
+                    "help": "output raw JSON instead of pretty table",
+                },
+            ),
+        ),
+    ),
+}
+
+
+def _add_command(subparsers: Any, name: str, spec: _CommandSpec) -> None:
+    """Register name (and any nested group) on an argparse subparsers action."""
+    parser = subparsers.add_parser(name, help=spec.help)
+    for flags, kwargs in spec.args:
+        parser.add_argument(*flags, **kwargs)
+    if spec.group is not None:
+        dest, group_help, children = spec.group
+        group = parser.add_subparsers(dest=dest, help=group_help)
+        for child_name, child in children.items():
+            _add_command(group, child_name, child)
+
+
+# Root options that consume the following token as their value
+_ROOT_VALUE_OPTIONS = frozenset({"--config", "--output"})
+# Root options that take no value
+_ROOT_FLAGS = frozenset({"--debug", "--quiet", "--dry-run"})
+
+
+def _first_root_token(argv: list[str]) -> str | None:
+    """Return the first token that decides which subparsers are needed.
+
+    That is -h/--help, --version, the first positional (the command) or
+    any other option, skipping exact root options and their values; None
+    when argv has none of them. An abbreviated root option (--out) is
+    returned as is, so the caller builds every command instead of taking
+    its value for the command name.
+    """
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+        elif token in _ROOT_VALUE_OPTIONS:
+            skip_value = True
+        elif token in _ROOT_FLAGS or token.split("=", 1)[0] in _ROOT_VALUE_OPTIONS:
+            continue
+        else:
+            return token
+    return None
 
-    # Status command
-    subparsers.add_parser("status", help="show configuration and system status")
 
-    # Service (daemon) command
-    service_parser = subparsers.add_parser(
-        "service", help="run continuous service (periodic scrape + MQTT)"
-    )
-    service_parser.add_argument(
-        "--once", action="store_true", help="run a single cycle then exit"
-    )
-    service_parser.add_argument(
-        "--interval", type=int, help="override scrape interval seconds"
-    )
-    service_parser.add_argument(
-        "--cleanup-discovery",
-        action="store_true",
-        help="cleanup legacy/duplicate discovery entities and exit",
-    )
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the command named in argv, or None if there is no usable one.
 
-    # Cache command group
-    cache_parser = subparsers.add_parser("cache", help="manage AI shortening cache")
-    cache_subparsers = cache_parser.add_subparsers(
-        dest="cache_command", help="cache operations"
-    )
-    cache_subparsers.add_parser("clear", help="clear AI shortening cache")
-    cache_subparsers.add_parser("stats", help="show cache statistics")
-    cache_subparsers.add_parser(
-        "reprocess", help="reprocess cached items with current configuration"
-    )
+    The first positional token is the command. None is returned when it is
+    missing or unknown, or when -h/--help or an abbreviated root option
+    comes before it, so that the root help, argparse's prefix matching and
+    its "invalid choice" error all see every command.
+    """
+    token = _first_root_token(argv)
+    return token if token in _SUBCOMMANDS else None
 
-    # Validate command group
-    validate_parser = subparsers.add_parser(
-        "validate", help="validate system components"
-    )
-    validate_subparsers = validate_parser.add_subparsers(
-        dest="validate_command", help="validation operations"
-    )
 
-    # Web server validation
-    web_validate_parser = validate_subparsers.add_parser(
-        "web", help="validate web server configuration and connectivity"
-    )
-    web_validate_parser.add_argument(
-        "--host", help="web server host to test (overrides config)"
-    )
-    web_validate_parser.add_argument(
-        "--port", type=int, help="web server port to test (overrides config)"
-    )
-    web_validate_parser.add_argument(
-        "--timeout", type=float, default=10.0, help="request timeout in seconds"
-    )
-    web_validate_parser.add_argument(
-        "--start-server",
-        action="store_true",
-        help="start the web server before validation (for testing)",
-    )
-    web_validate_parser.add_argument(
-        "--check-files",
-        action="store_true",
-        help="validate that expected output files are served correctly",
-    )
-    web_validate_parser.add_argument(
-        "--external-url",
-        help="external URL base to test (overrides host:port, useful for Docker/proxy)",
-    )
+def create_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Create the argument parser with all CLI commands.
 
-    # Config validation
-    config_validate_parser = validate_subparsers.add_parser(
-        "config", help="validate configuration file and environment variables"
-    )
-    config_validate_parser.add_argument(
-        "--strict", action="store_true", help="enable strict validation mode"
+    When argv is given and names a command, only that command's entry in
+    _SUBCOMMANDS is built; the rest are skipped. A leading --version builds
+    none, since argparse prints the version and exits before a command is
+    parsed.
+    """
+    parser = _build_root_parser()
+    subparsers = parser.add_subparsers(
+        dest="command", help="available commands", required=False
     )
+    token = _first_root_token(argv) if argv is not None else None
+    if token == "--version":
+        return parser
+    if token in _SUBCOMMANDS:
+        _add_command(subparsers, token, _SUBCOMMANDS[token])
+    else:
+        for name, spec in _SUBCOMMANDS.items():
+            _add_command(subparsers, name, spec)
+    return parser
 
-    # Commands (registry) introspection
-    commands_parser = subparsers.add_parser(
-        "commands", help="print supported command registry (discovery metadata)"
-    )
-    commands_parser.add_argument(
-        "--json", action="store_true", help="output raw JSON instead of pretty table"
-    )
 
-    return parser
+@lru_cache(maxsize=4)
+def _load_config(path: str, abspath: str, mtime_ns: int, size: int) -> Config:
+    return _lazy("Config").from_file(path)
 
 
+def _config_from_file(path: str) -> Config:
+    """Config.from_file, memoised on the file's path, mtime and size.
+
+    cmd_all and the commands it chains load the same file; this parses the
+    YAML once per run while still picking up edits to the file. The
+    nanosecond mtime plus size catches rewrites within one timestamp tick.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Not found as given; from_file resolves it against the project root
+        return _lazy("Config").from_file(path)
+    return _load_config(path, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
 def _get_version() -> str:
-    """Get the package version."""
+    """Get the package version (resolved once per process)."""
     try:
         from twickenham_events import __version__
 
@@ -243,9 +426,24 @@ def _get_version() -> str:
         return "0.0.0-dev"
 
 
-def _setup_logging(debug: bool = False) -> None:
-    """Setup logging configuration."""
-    level = logging.DEBUG if debug else logging.INFO
+def _setup_logging(debug: bool = False, quiet: bool = False) -> None:
+    """Setup logging configuration.
+
+    --quiet raises the level to WARNING, so the backends' lazily formatted
+    info records are dropped before formatting; --debug takes precedence.
+    """
+    if debug:
+        level = logging.DEBUG
+    elif quiet:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+    root = logging.getLogger()
+    if root.handlers:
+        # Already configured (test harness, embedding app): basicConfig would
+        # only take the lock to do nothing, so just apply the level
+        root.setLevel(level)
+        return
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -253,29 +451,100 @@ def _setup_logging(debug: bool = False) -> None:
     )
 
 
-def cmd_scrape(args):
+class ScrapeResult(NamedTuple):
+    """One scrape, shared in memory by the commands that cmd_all chains."""
+
+    raw_events: list[dict[str, Any]]
+    stats: dict[str, Any]
+    summarized_events: list[dict[str, Any]]
+    errors: list[str]
+
+
+def _upcoming_event(ev: dict[str, Any], day_date: Any) -> dict[str, Any]:
+    """ev in the all_upcoming schema: date present and no display-only title.
+
+    Events that already match are returned as-is; otherwise a single new
+    dict is built with both fixes applied.
+    """
+    needs_date = bool(day_date) and "date" not in ev
+    if not needs_date and "title" not in ev:
+        return ev
+    out = {k: v for k, v in ev.items() if k != "title"}
+    if needs_date:
+        out["date"] = day_date
+    return out
+
+
+def _flatten_upcoming(summarized_events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Flat event list in the upcoming_events.json / MQTT all_upcoming schema."""
+    # summarized_events' inner events already include date (post-refactor),
+    # so most events pass through _upcoming_event without a copy.
+    return [
+        _upcoming_event(ev, day.get("date"))
+        for day in summarized_events
+        for ev in day.get("events", [])
+    ]
+
+
+def _json_indented(data: Any) -> bytes:
+    """Encode data as indented JSON, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - depends on environment
+        return json.dumps(data, indent=2, default=str).encode()
+    # Datetimes pass through to default=str so the text matches json.dumps'
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write indented JSON to path atomically.
+
+    The bytes go to a sibling temp file that then replaces path, so readers
+    (the web server, a concurrent mqtt run) never see a half-written file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(_json_indented(data))
+    os.replace(tmp, path)
+
+
+def cmd_scrape(
+    args, pre_scraped: ScrapeResult | None = None, config: Config | None = None
+) -> int:
     """Handle the scrape command."""
-    import json
+    return _run_scrape(args, pre_scraped, config)[0]
 
-    from .config import Config
 
-    print("🏉 \033[1mTwickenham Events Scraper\033[0m")
+def _run_scrape(
+    args, pre_scraped: ScrapeResult | None = None, config: Config | None = None
+) -> tuple[int, ScrapeResult | None]:
+    """Body of cmd_scrape; also returns the scrape for chained commands.
+
+    With pre_scraped, the network fetch and summarising are skipped and the
+    given results are reported and saved instead. A config already loaded by
+    the caller is used as-is.
+    """
+
+    print(f"🏉 {BOLD}Twickenham Events Scraper{RESET}")
     print("=" * 50)
 
-    # Load configuration
-    config = Config.from_file(args.config)
+    # Load configuration unless the caller (cmd_all) already has it
+    if config is None:
+        config = _config_from_file(args.config)
     url = config.get("scraping.url")
 
     if not url:
-        print("\033[31m❌ Error: No scraping URL configured\033[0m")
+        print(f"{RED}❌ Error: No scraping URL configured{RESET}")
         print("   Please set 'scraping.url' in your config file")
-        return 1
-
-    # Initialize scraper
-    scraper = EventScraper(config)
+        return 1, None
 
     if args.dry_run:
-        print(f"\033[33m🔍 DRY RUN: Would scrape from: {url}\033[0m")
+        print(f"{YELLOW}🔍 DRY RUN: Would scrape from: {url}{RESET}")
         print(f"   Max retries: {config.get('scraping.max_retries', 3)}")
         print(f"   Timeout: {config.get('scraping.timeout', 10)}s")
         print(
@@ -284,24 +553,33 @@ def cmd_scrape(args):
         print(
             f"   AI type detection: {'enabled' if config.get('ai_processor.type_detection.enabled', False) else 'disabled'}"
         )
-        return 0
+        return 0, None
+
+    # Initialize scraper (not needed, nor imported, for dry runs)
+    scraper = _lazy("EventScraper")(config)
 
     try:
-        # Scrape raw events
-        print(f"🌐 Scraping events from: {url}")
-        raw_events, stats = scraper.scrape_events(url)
+        summarized_events: list[dict[str, Any]] | None = None
+        if pre_scraped is not None:
+            raw_events, stats, summarized_events, error_log = pre_scraped
+        else:
+            # Scrape raw events
+            print(f"🌐 Scraping events from: {url}")
+            raw_events, stats = scraper.scrape_events(url)
+            error_log = scraper.error_log
 
         if not raw_events:
-            print("\033[33m📭 No events found\033[0m")
-            if scraper.error_log:
-                print("\n\033[31mErrors encountered:\033[0m")
-                for error in scraper.error_log:
+            print(f"{YELLOW}📭 No events found{RESET}")
+            if error_log:
+                print(f"\n{RED}Errors encountered:{RESET}")
+                for error in error_log:
                     print(f"   • {error}")
-            return 0
+            return 0, ScrapeResult(raw_events, stats, [], error_log)
 
-        # Process and summarize events
-        print(f"\n📊 Processing {len(raw_events)} raw events...")
-        summarized_events = scraper.summarize_events(raw_events)
+        if summarized_events is None:
+            # Process and summarize events
+            print(f"\n📊 Processing {len(raw_events)} raw events...")
+            summarized_events = scraper.summarize_events(raw_events)
 
         # Find next event
         next_event, next_day_summary = scraper.find_next_event_and_summary(
@@ -309,14 +587,14 @@ def cmd_scrape(args):
         )
 
         # Display results
-        print("\n\033[32m✅ Processing complete!\033[0m")
+        print(f"\n{GREEN}✅ Processing complete!{RESET}")
         print(f"   Raw events found: {stats['raw_events_count']}")
         print(f"   Future events: {len(summarized_events)}")
         print(f"   Fetch duration: {stats['fetch_duration']}s")
         print(f"   Retry attempts: {stats['retry_attempts']}")
 
         if next_event:
-            print("\n🎯 \033[1mNext Event:\033[0m")
+            print(f"\n🎯 {BOLD}Next Event:{RESET}")
             if next_day_summary:
                 print(f"   📅 Date: {next_day_summary['date']}")
             print(f"   🏆 Event: {next_event['fixture']}")
@@ -329,10 +607,8 @@ def cmd_scrape(args):
 
         # Save to file(s) if requested
         if args.output:
-            from pathlib import Path
-
             output_dir = Path(args.output)
-            output_dir.mkdir(exist_ok=True)
+            output_dir.mkdir(parents=True, exist_ok=True)
 
             # 1. Rich scrape results bundle (diagnostics + summaries)
             results_file = output_dir / "scrape_results.json"
@@ -342,10 +618,9 @@ def cmd_scrape(args):
                 "summarized_events": summarized_events,
                 "next_event": next_event,
                 "next_day_summary": next_day_summary,
-                "errors": scraper.error_log,
+                "errors": error_log,
             }
-            with open(results_file, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2, default=str)
+            _write_json(results_file, output_data)
 
             # 2. Flat upcoming events file expected by other commands (e.g. mqtt)
             #    Schema upgraded for parity with MQTT all_upcoming topic:
@@ -355,77 +630,81 @@ def cmd_scrape(args):
             #         "generated_ts": <epoch>,
             #         "last_updated": <iso8601>
             #      }
-            #    summarized_events' inner events already include date (post-refactor),
-            #    so we can flatten directly without injection logic.
-            flat_events: list[dict[str, Any]] = []
-            for day in summarized_events:
-                day_date = day.get("date")
-                for ev in day.get("events", []):
-                    # Ensure date present
-                    base_ev = ev
-                    if ("date" not in base_ev) and day_date:
-                        base_ev = base_ev.copy()
-                        base_ev["date"] = day_date
-                    # Remove any legacy/display-only title to match MQTT schema
-                    if "title" in base_ev:
-                        if base_ev is ev:
-                            base_ev = base_ev.copy()
-                        base_ev.pop("title", None)
-                    flat_events.append(base_ev)
+            flat_events = _flatten_upcoming(summarized_events)
             upcoming_file = output_dir / "upcoming_events.json"
-            with open(upcoming_file, "w", encoding="utf-8") as f:
-                now_epoch = int(time.time())
-                now_iso = datetime.now().isoformat()
-                json.dump(
-                    {
-                        "events": flat_events,
-                        "count": len(flat_events),
-                        "generated_ts": now_epoch,
-                        "last_updated": now_iso,
-                    },
-                    f,
-                    indent=2,
-                    default=str,
-                )
+            # One clock read so generated_ts and last_updated always agree
+            now = datetime.now()
+            _write_json(
+                upcoming_file,
+                {
+                    "events": flat_events,
+                    "count": len(flat_events),
+                    "generated_ts": int(now.timestamp()),
+                    "last_updated": now.isoformat(),
+                },
+            )
 
             print(
                 f"\n💾 Results saved: {results_file.name} (detailed), {upcoming_file.name} (flat events: {len(flat_events)}) in {output_dir}"
             )
 
         # Show errors if any
-        if scraper.error_log:
-            print(f"\n\033[33m⚠️  {len(scraper.error_log)} warnings/errors:\033[0m")
-            for error in scraper.error_log:
+        if error_log:
+            print(f"\n{YELLOW}⚠️  {len(error_log)} warnings/errors:{RESET}")
+            for error in error_log:
                 print(f"   • {error}")
 
-        return 0
+        return 0, ScrapeResult(raw_events, stats, summarized_events, error_log)
 
     except Exception as e:
-        print(f"\n\033[31m❌ Scraping failed: {e}\033[0m")
-        return 1
+        print(f"\n{RED}❌ Scraping failed: {e}{RESET}")
+        return 1, None
+
+
+def _fixture_emojis(
+    summarized_events: list[dict[str, Any]], config: Config
+) -> dict[str, str]:
+    """Emoji for each distinct fixture without pre-computed AI data.
+
+    Repeated fixtures (e.g. the same match listed on several days) are looked
+    up once instead of once per row. The AI processor is only constructed
+    when some event actually lacks pre-computed data.
+    """
+    fixtures = {
+        event["fixture"]
+        for day in summarized_events
+        for event in day["events"]
+        if "ai_emoji" not in event
+    }
+    if not fixtures:
+        return {}
+    ai_processor = _lazy("AIProcessor")(config)
+    if not ai_processor:
+        return dict.fromkeys(fixtures, "🏟️")  # Default emoji
+    return {
+        fixture: ai_processor.get_event_type_and_icons(fixture)[1]
+        for fixture in fixtures
+    }
 
 
 def cmd_list(args):
     """List upcoming events with filtering and formatting options."""
-    import json
-
-    from .config import Config
+    EventScraper = _lazy("EventScraper")
 
     # Load configuration
-    config = Config.from_file(args.config)
+    config = _config_from_file(args.config)
     url = config.get("scraping.url")
 
     if not url:
-        print("\033[31m❌ Error: No scraping URL configured\033[0m")
+        print(f"{RED}❌ Error: No scraping URL configured{RESET}")
         print("   Please set 'scraping.url' in your config file")
         return 1
 
-    # Initialize scraper and AI processor
+    # Initialize scraper (the AI processor is created only if needed)
     scraper = EventScraper(config)
-    ai_processor = AIProcessor(config)
 
     if args.dry_run:
-        print(f"\033[33m🔍 DRY RUN: Would scrape from: {url}\033[0m")
+        print(f"{YELLOW}🔍 DRY RUN: Would scrape from: {url}{RESET}")
         print(f"   Output format: {args.format}")
         if args.output:
             print(f"   Would save to: {args.output}")
@@ -434,21 +713,24 @@ def cmd_list(args):
     # Scrape events
     raw_events, stats = scraper.scrape_events(url)
     if not raw_events:
-        print("\033[33m📭 No events found\033[0m")
+        print(f"{YELLOW}📭 No events found{RESET}")
         return 0
 
     # Process events
     summarized_events = scraper.summarize_events(raw_events)
     if not summarized_events:
-        print("\033[33m📭 No upcoming events found\033[0m")
+        print(f"{YELLOW}📭 No upcoming events found{RESET}")
         return 0
 
     # Apply date filtering
     if args.limit:
         summarized_events = summarized_events[: args.limit]
 
+    if args.format != "json":
+        fixture_emojis = _fixture_emojis(summarized_events, config)
+
     if args.format == "json":
-        print(json.dumps(summarized_events, indent=2, default=str))
+        sys.stdout.write(_json_indented(summarized_events).decode() + "\n")
     elif args.format == "simple":
         for day_summary in summarized_events:
             date_str = day_summary["date"]
@@ -459,45 +741,39 @@ def cmd_list(args):
 
             for event in day_summary["events"]:
                 fixture = event["fixture"]
-                # Use pre-computed AI data if available, otherwise fallback to AI processor
-                if "ai_emoji" in event:
-                    emoji = event["ai_emoji"]
-                elif ai_processor:
-                    event_type, emoji, mdi_icon = ai_processor.get_event_type_and_icons(
-                        fixture
-                    )
-                else:
-                    emoji = "🏟️"  # Default emoji
+                # Use pre-computed AI data if available, otherwise the lookup
+                emoji = (
+                    event["ai_emoji"]
+                    if "ai_emoji" in event
+                    else fixture_emojis[fixture]
+                )
 
                 time_str = event.get("start_time") or "TBC"
                 print(f"   {emoji} {fixture} ({time_str})")
     else:  # detailed format
-        print(f"\033[1m📋 Upcoming Events ({len(summarized_events)} days)\033[0m")
-        print()
+        # Collected and written once: a full listing is hundreds of lines
+        out = [f"{BOLD}📋 Upcoming Events ({len(summarized_events)} days){RESET}\n\n"]
 
         for day_summary in summarized_events:
             date_str = day_summary["date"]
             event_count = len(day_summary["events"])
             earliest_time = day_summary.get("earliest_start", "TBC")
 
-            print(
-                f"📅 \033[1m{date_str}\033[0m ({event_count} event{'s' if event_count != 1 else ''})"
+            out.append(
+                f"📅 {BOLD}{date_str}{RESET} ({event_count} event{'s' if event_count != 1 else ''})\n"
             )
             if earliest_time != "TBC":
-                print(f"   ⏰ Earliest: {earliest_time}")
-            print()
+                out.append(f"   ⏰ Earliest: {earliest_time}\n")
+            out.append("\n")
 
             for event in day_summary["events"]:
                 fixture = event["fixture"]
-                # Use pre-computed AI data if available, otherwise fallback to AI processor
-                if "ai_emoji" in event:
-                    emoji = event["ai_emoji"]
-                elif ai_processor:
-                    event_type, emoji, mdi_icon = ai_processor.get_event_type_and_icons(
-                        fixture
-                    )
-                else:
-                    emoji = "🏟️"  # Default emoji
+                # Use pre-computed AI data if available, otherwise the lookup
+                emoji = (
+                    event["ai_emoji"]
+                    if "ai_emoji" in event
+                    else fixture_emojis[fixture]
+                )
 
                 short_name = event.get("fixture_short")
                 time_str = event.get("start_time") or "TBC"
@@ -510,15 +786,16 @@ def cmd_list(args):
                     else ""
                 )
 
-                print(f"   {emoji} {fixture}")
+                out.append(f"   {emoji} {fixture}\n")
                 if short_name and short_name != fixture:
-                    print(f"      📝 Short: {short_name}")
-                print(f"      ⏰ Time: {time_str}")
+                    out.append(f"      📝 Short: {short_name}\n")
+                out.append(f"      ⏰ Time: {time_str}\n")
                 if crowd:
-                    print(f"      👥 Crowd: {crowd}")
+                    out.append(f"      👥 Crowd: {crowd}\n")
                 if event_num:
-                    print(f"      🔢 Event: {event_num}")
-                print()
+                    out.append(f"      🔢 Event: {event_num}\n")
+                out.append("\n")
+        sys.stdout.write("".join(out))
 
         # Save to file if requested
         if args.output:
@@ -527,26 +804,29 @@ def cmd_list(args):
                     if args.format == "json":
                         json.dump(summarized_events, f, indent=2, default=str)
                     else:
-                        # Save detailed format to file
-                        f.write(f"Upcoming Events ({len(summarized_events)} days)\n")
-                        f.write("=" * 50 + "\n\n")
+                        # Save detailed format to file (plain text, one write)
+                        parts = [
+                            f"Upcoming Events ({len(summarized_events)} days)\n",
+                            "=" * 50 + "\n\n",
+                        ]
 
                         for day_summary in summarized_events:
                             date_str = day_summary["date"]
                             event_count = len(day_summary["events"])
-                            f.write(
+                            parts.append(
                                 f"{date_str} ({event_count} event{'s' if event_count != 1 else ''})\n"
                             )
 
                             for event in day_summary["events"]:
                                 fixture = event["fixture"]
                                 time_str = event.get("start_time") or "TBC"
-                                f.write(f"  - {fixture} ({time_str})\n")
-                            f.write("\n")
+                                parts.append(f"  - {fixture} ({time_str})\n")
+                            parts.append("\n")
+                        f.write("".join(parts))
 
-                print(f"\033[32m✅ Events saved to: {args.output}\033[0m")
+                print(f"{GREEN}✅ Events saved to: {args.output}{RESET}")
             except Exception as e:
-                print(f"\033[31m❌ Failed to save events: {e}\033[0m")
+                print(f"{RED}❌ Failed to save events: {e}{RESET}")
                 return 1
 
     return 0
@@ -554,14 +834,11 @@ def cmd_list(args):
 
 def cmd_next(args):
     """Show only the next upcoming event."""
-    import json
-    from pathlib import Path
-
-    from .config import Config
+    EventScraper = _lazy("EventScraper")
 
     try:
         # Load configuration
-        config = Config.from_file(args.config)
+        config = _config_from_file(args.config)
 
         if args.dry_run:
             print("🎯 Next Twickenham Event")
@@ -574,7 +851,6 @@ def cmd_next(args):
 
         # Get events
         scraper = EventScraper(config)
-        ai_processor = AIProcessor(config)
         url = config.get("scraping.url")
         raw_events, stats = scraper.scrape_events(url)
 
@@ -603,14 +879,14 @@ def cmd_next(args):
 
         # Display the next event in detail
         date_obj = datetime.strptime(next_day_summary["date"], "%Y-%m-%d")
-        print(f"📅 \033[1m{date_obj.strftime('%A, %B %d, %Y')}\033[0m")
+        print(f"📅 {BOLD}{date_obj.strftime('%A, %B %d, %Y')}{RESET}")
         print()
 
         fixture = next_event["fixture"]
         # Use pre-computed AI data if available, otherwise fallback to AI processor
         if "ai_emoji" in next_event:
             emoji = next_event["ai_emoji"]
-        elif ai_processor:
+        elif ai_processor := _lazy("AIProcessor")(config):
             event_type, emoji, mdi_icon = ai_processor.get_event_type_and_icons(fixture)
         else:
             emoji = "🏟️"  # Default emoji
@@ -626,7 +902,7 @@ def cmd_next(args):
             else ""
         )
 
-        print(f"{emoji} \033[1m{fixture}\033[0m")
+        print(f"{emoji} {BOLD}{fixture}{RESET}")
         if short_name and short_name != fixture:
             print(f"   📝 Short: {short_name}")
         print(f"   ⏰ Time: {time_str}")
@@ -638,8 +914,9 @@ def cmd_next(args):
         # Show additional context if multiple events that day
         if next_event["event_count"] > 1:
             print("\n📋 Other events this day:")
+            # next_event is an element of this list, so identity suffices
             for event in next_day_summary["events"]:
-                if event != next_event:
+                if event is not next_event:
                     event_time = event.get("start_time") or "TBC"
                     event_short = event.get("fixture_short", event["fixture"])
                     print(f"   • {event_short} at {event_time}")
@@ -648,10 +925,8 @@ def cmd_next(args):
 
         # Save to file if requested
         if args.output:
-            from pathlib import Path
-
             output_dir = Path(args.output)
-            output_dir.mkdir(exist_ok=True)
+            output_dir.mkdir(parents=True, exist_ok=True)
             output_file = output_dir / "next_event.json"
 
             output_data = {
@@ -662,34 +937,38 @@ def cmd_next(args):
                 "errors": scraper.error_log,
             }
 
-            with open(output_file, "w") as f:
-                json.dump(output_data, f, indent=2, default=str)
+            _write_json(output_file, output_data)
             print(f"💾 Results saved to: {output_file}")
 
         # Show errors if any
         if scraper.error_log:
-            print(f"\n\033[33m⚠️  {len(scraper.error_log)} warnings/errors:\033[0m")
+            print(f"\n{YELLOW}⚠️  {len(scraper.error_log)} warnings/errors:{RESET}")
             for error in scraper.error_log:
                 print(f"   • {error}")
 
         return 0
 
     except Exception as e:
-        print(f"\n\033[31m❌ Failed to get next event: {e}\033[0m")
+        print(f"\n{RED}❌ Failed to get next event: {e}{RESET}")
         return 1
 
 
-def cmd_mqtt(args) -> int:
-    """Scrape events and publish to MQTT."""
-    from pathlib import Path
+def cmd_mqtt(
+    args, pre_scraped: ScrapeResult | None = None, config: Config | None = None
+) -> int:
+    """Scrape events (unless pre_scraped is given) and publish to MQTT."""
+    AIProcessor = _lazy("AIProcessor")
+    AvailabilityPublisher = _lazy("AvailabilityPublisher")
+    LibMQTTPublisher = _lazy("LibMQTTPublisher")
+    MQTTClient = _lazy("MQTTClient")
+    publish_device_level_discovery = _lazy("publish_device_level_discovery")
 
-    from .config import Config
+    print(f"\n{BLUE_BRIGHT}📡 MQTT PUBLISHING{RESET}")
+    print(BLUE_BRIGHT + "─" * 15 + RESET)
 
-    print("\n\033[94m📡 MQTT PUBLISHING\033[0m")
-    print("\033[94m" + "─" * 15 + "\033[0m")
-
-    # Load configuration
-    config = Config.from_file(args.config)
+    # Load configuration unless the caller (cmd_all) already has it
+    if config is None:
+        config = _config_from_file(args.config)
     output_dir = (
         Path(args.output)
         if hasattr(args, "output") and args.output
@@ -697,7 +976,7 @@ def cmd_mqtt(args) -> int:
     )
 
     if args.dry_run:
-        print("🧪 \033[33mDRY RUN MODE\033[0m - Testing MQTT without publishing")
+        print(f"🧪 {YELLOW}DRY RUN MODE{RESET} - Testing MQTT without publishing")
 
     # First scrape (force writing to our resolved output_dir to avoid stale file reads)
     try:
@@ -705,28 +984,30 @@ def cmd_mqtt(args) -> int:
     except Exception:
         # In case args is a frozen namespace, fall back silently
         pass
-    scrape_result = cmd_scrape(args)
-    if scrape_result != 0:
-        return scrape_result
-
+    # Checked before scraping so a disabled broker doesn't cost a fetch
     if not config.mqtt_enabled:
         print("❌ MQTT is not enabled in configuration")
         return 1
 
+    scrape_result, scraped = _run_scrape(args, pre_scraped, config)
+    if scrape_result != 0:
+        return scrape_result
+
     if args.dry_run:
         print("🧪 Would publish to MQTT broker")
         return 0
 
     try:
-        # Load scraped events
-        with open(output_dir / "upcoming_events.json") as f:
-            data = json.load(f)
-        events = data.get("events", [])
+        # Same flat events the scrape just wrote to upcoming_events.json,
+        # taken from memory rather than re-reading the file
+        events = _flatten_upcoming(scraped.summarized_events) if scraped else []
 
         # Initialize AI processor for icon detection
         ai_processor = AIProcessor(config)
 
-        # Show effective MQTT configuration (masked password) so user can verify real env/config values
+        # Show effective MQTT configuration (masked password) so user can verify real env/config values.
+        # Resolved once and reused for discovery so the shown client_id is the one used.
+        eff_cfg: dict[str, Any] | None = None
         try:
             eff_cfg = config.get_mqtt_config()
             auth_cfg = eff_cfg.get("auth") or {}
@@ -745,7 +1026,7 @@ def cmd_mqtt(args) -> int:
         # Publish Home Assistant discovery (device bundle format)
         try:
             AVAILABILITY_TOPIC = "twickenham_events/availability"
-            cfg = config.get_mqtt_config()
+            cfg = eff_cfg if eff_cfg is not None else config.get_mqtt_config()
 
             # Clean up undefined TLS certificate paths for ha-mqtt-publisher
             if "tls" in cfg and isinstance(cfg["tls"], dict):
@@ -796,20 +1077,22 @@ def cmd_mqtt(args) -> int:
         return 1
 
 
-def cmd_calendar(args):
-    """Handle the calendar command."""
-    from pathlib import Path
-
-    from .config import Config
+def cmd_calendar(
+    args, pre_scraped: ScrapeResult | None = None, config: Config | None = None
+):
+    """Handle the calendar command; pre_scraped skips the scrape."""
+    CalendarGenerator = _lazy("CalendarGenerator")
+    EventScraper = _lazy("EventScraper")
 
-    print("📅 \033[1mTwickenham Events Calendar\033[0m")
+    print(f"📅 {BOLD}Twickenham Events Calendar{RESET}")
     print("=" * 50)
 
-    # Load configuration
-    config = Config.from_file(args.config)
+    # Load configuration unless the caller (cmd_all) already has it
+    if config is None:
+        config = _config_from_file(args.config)
 
     if args.dry_run:
-        print("\033[33m🔍 DRY RUN: Would scrape events and generate calendar\033[0m")
+        print(f"{YELLOW}🔍 DRY RUN: Would scrape events and generate calendar{RESET}")
         print(f"   Calendar enabled: {config.get('calendar.enabled', True)}")
         print(
             f"   Output filename: {config.get('calendar.filename', 'twickenham_events.ics')}"
@@ -820,37 +1103,45 @@ def cmd_calendar(args):
     try:
         # Check if calendar generation is enabled
         if not config.get("calendar.enabled", True):
-            print("\033[31m❌ Calendar generation is disabled in configuration\033[0m")
+            print(f"{RED}❌ Calendar generation is disabled in configuration{RESET}")
             print("   Set 'calendar.enabled: true' in your config file")
             return 1
 
-        # Scrape events first
-        print("🌐 Scraping events...")
-        scraper = EventScraper(config)
-        url = config.get("scraping.url")
+        summarized_events: list[dict[str, Any]] | None = None
+        if pre_scraped is not None:
+            raw_events, _stats, summarized_events, error_log = pre_scraped
+        else:
+            # Scrape events first
+            print("🌐 Scraping events...")
+            scraper = EventScraper(config)
+            url = config.get("scraping.url")
 
-        if not url:
-            print("\033[31m❌ Error: No scraping URL configured\033[0m")
-            return 1
+            if not url:
+                print(f"{RED}❌ Error: No scraping URL configured{RESET}")
+                return 1
 
-        raw_events, stats = scraper.scrape_events(url)
+            raw_events, stats = scraper.scrape_events(url)
+            error_log = scraper.error_log
 
         if not raw_events:
-            print("\033[33m📭 No events found - cannot generate calendar\033[0m")
+            print(f"{YELLOW}📭 No events found - cannot generate calendar{RESET}")
             return 0
 
-        # Process events
-        print(f"📊 Processing {len(raw_events)} raw events...")
-        summarized_events = scraper.summarize_events(raw_events)
+        if summarized_events is None:
+            # Process events
+            print(f"📊 Processing {len(raw_events)} raw events...")
+            summarized_events = scraper.summarize_events(raw_events)
 
         if not summarized_events:
-            print("\033[33m📭 No future events found - cannot generate calendar\033[0m")
+            print(
+                f"{YELLOW}📭 No future events found - cannot generate calendar{RESET}"
+            )
             return 0
 
         # Generate calendar
         print(f"\n📅 Generating calendar with {len(summarized_events)} event days...")
         output_dir = Path(args.output) if args.output else Path("output")
-        output_dir.mkdir(exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
         generator = CalendarGenerator(config)
         result, ics_path = generator.generate_ics_calendar(
@@ -858,7 +1149,7 @@ def cmd_calendar(args):
         )
 
         if result and ics_path:
-            print("\n\033[32m✅ Calendar generated successfully!\033[0m")
+            print(f"\n{GREEN}✅ Calendar generated successfully!{RESET}")
             print(f"   📁 File: {ics_path}")
             print(f"   📊 Events: {result['stats']['total_events']}")
 
@@ -867,40 +1158,38 @@ def cmd_calendar(args):
                 print(f"   🌐 Public URL: {result['calendar_url']}")
 
             # Show errors if any
-            if scraper.error_log:
+            if error_log:
                 print(
-                    f"\n\033[33m⚠️  {len(scraper.error_log)} warnings during processing:\033[0m"
+                    f"\n{YELLOW}⚠️  {len(error_log)} warnings during processing:{RESET}"
                 )
-                for error in scraper.error_log:
+                for error in error_log:
                     print(f"   • {error}")
 
             return 0
         else:
-            print("\n\033[31m❌ Failed to generate calendar\033[0m")
+            print(f"\n{RED}❌ Failed to generate calendar{RESET}")
             return 1
 
     except Exception as e:
-        print(f"\n\033[31m❌ Calendar generation failed: {e}\033[0m")
+        print(f"\n{RED}❌ Calendar generation failed: {e}{RESET}")
         return 1
 
 
 def cmd_all(args) -> int:
     """Run all integrations (scrape + MQTT + calendar)."""
-    from .config import Config
-
-    print("\n\033[96m🎯 ALL INTEGRATIONS\033[0m")
-    print("\033[96m" + "─" * 18 + "\033[0m")
+    print(f"\n{CYAN_BRIGHT}🎯 ALL INTEGRATIONS{RESET}")
+    print(CYAN_BRIGHT + "─" * 18 + RESET)
 
     # Load configuration
-    config = Config.from_file(args.config)
+    config = _config_from_file(args.config)
 
     if args.dry_run:
-        print("🧪 \033[33mDRY RUN MODE\033[0m - Testing all integrations")
+        print(f"🧪 {YELLOW}DRY RUN MODE{RESET} - Testing all integrations")
 
     results = []
 
-    # 1. Scraping
-    scrape_result = cmd_scrape(args)
+    # 1. Scraping (once; MQTT and calendar reuse the result)
+    scrape_result, scraped = _run_scrape(args, config=config)
     results.append(("Scraping", "✅" if scrape_result == 0 else "❌"))
 
     if scrape_result != 0:
@@ -909,21 +1198,21 @@ def cmd_all(args) -> int:
 
     # 2. MQTT (if enabled)
     if config.mqtt_enabled:
-        mqtt_result = cmd_mqtt(args)
+        mqtt_result = cmd_mqtt(args, pre_scraped=scraped, config=config)
         results.append(("MQTT", "✅" if mqtt_result == 0 else "❌"))
     else:
         results.append(("MQTT", "⏭️ Disabled"))
 
     # 3. Calendar (if enabled)
     if config.calendar_enabled:
-        calendar_result = cmd_calendar(args)
+        calendar_result = cmd_calendar(args, pre_scraped=scraped, config=config)
         results.append(("Calendar", "✅" if calendar_result == 0 else "❌"))
     else:
         results.append(("Calendar", "⏭️ Disabled"))
 
     # Summary
-    print("\n\033[96m📊 SUMMARY\033[0m")
-    print("\033[96m" + "─" * 10 + "\033[0m")
+    print(f"\n{CYAN_BRIGHT}📊 SUMMARY{RESET}")
+    print(CYAN_BRIGHT + "─" * 10 + RESET)
     for name, status in results:
         print(f"  {name}: {status}")
 
@@ -932,8 +1221,8 @@ def cmd_all(args) -> int:
 
 def cmd_status(config: Config, args) -> int:
     """Show configuration and system status."""
-    print("\n\033[96m📊 TWICKENHAM EVENTS STATUS\033[0m")
-    print("\033[96m" + "=" * 30 + "\033[0m")
+    print(f"\n{CYAN_BRIGHT}📊 TWICKENHAM EVENTS STATUS{RESET}")
+    print(CYAN_BRIGHT + "=" * 30 + RESET)
 
     # Version
     print(f"Version: {_get_version()}")
@@ -961,7 +1250,7 @@ def cmd_status(config: Config, args) -> int:
         print(f"  Max length: {config.ai_max_length}")
 
         try:
-            processor = AIProcessor(config)
+            processor = _lazy("AIProcessor")(config)
             cache_stats = processor.get_cache_stats()
             print(f"  Cache entries: {cache_stats.get('count', 0)}")
         except Exception:
@@ -977,7 +1266,7 @@ def cmd_cache(config: Config, args) -> int:
         return 1
 
     try:
-        processor = AIProcessor(config)
+        processor = _lazy("AIProcessor")(config)
 
         if args.cache_command == "clear":
             processor.clear_cache()
@@ -1017,7 +1306,40 @@ def cmd_service(config: Config, args) -> int:
         print("❌ MQTT must be enabled for service mode")
         return 1
 
-    # imports moved to module top for linter compliance
+    AIProcessor = _lazy("AIProcessor")
+    AvailabilityPublisher = _lazy("AvailabilityPublisher")
+    CalendarGenerator = _lazy("CalendarGenerator")
+    EventScraper = _lazy("EventScraper")
+    HealthTracker = _lazy("HealthTracker")
+    MQTTClient = _lazy("MQTTClient")
+    install_global_signal_handler = _lazy("install_global_signal_handler")
+    mqtt = _lazy("mqtt")
+    publish_device_level_discovery = _lazy("publish_device_level_discovery")
+    # Service-only modules, kept out of the import path of the other commands
+    import queue
+    import signal
+    import ssl
+    import subprocess
+    import threading
+
+    # Command result/ack payloads: orjson when installed (bytes, which paho
+    # publishes as-is), matching the encoder message_handler uses for acks
+    try:
+        from orjson import dumps as dump_payload
+    except ImportError:  # pragma: no cover - depends on environment
+        dump_payload = json.JSONEncoder(separators=(",", ":")).encode
+
+    # Bound once here rather than re-imported on every cycle / message
+    from .command_processor import CommandProcessor
+    from .flatten import flatten_with_date
+    from .message_handler import (
+        MIRROR_QOS,
+        handle_command_message,
+        last_ack_properties,
+    )
+    from .mqtt_client import wait_published
+    from .plugin_loader import load_command_plugins
+    from .service_cycle import build_extra_status
 
     interval = args.interval or config.service_interval_seconds
     scraper = EventScraper(config)
@@ -1031,78 +1353,78 @@ def cmd_service(config: Config, args) -> int:
         max_publish_age_seconds=max(900, int(interval * 1.5))
     )
 
-    last_run = 0.0
-    lock = threading.Lock()
+    # Scheduling uses the monotonic clock so wall-clock jumps neither skip
+    # nor repeat a cycle; None until the first cycle has run
+    last_run_ns: int | None = None
+    interval_ns = int(interval * 1_000_000_000)
+    # One scrape at a time; a second caller is told "busy" instead of waiting
+    cycle_sema = threading.BoundedSemaphore(1)
     stop_flag = {"stop": False}
 
     AVAILABILITY_TOPIC = "twickenham_events/availability"
     availability = AvailabilityPublisher(None, AVAILABILITY_TOPIC)  # client set below
 
-    last_events_count = {"count": None}
+    last_events_count: int | None = None
 
     output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
     cal_gen = CalendarGenerator(config) if config.calendar_enabled else None
 
     def run_cycle(trigger: str, command_meta: dict | None = None) -> dict[str, Any]:
-        nonlocal last_run
-        with lock:
+        nonlocal last_run_ns, last_events_count
+        if not cycle_sema.acquire(blocking=False):
+            logging.info("service cycle skipped trigger=%s (cycle running)", trigger)
+            return {"events": 0, "no_changes": True, "busy": True}
+        try:
+            url = config.scraping_url
+            raw_events, stats = scraper.scrape_events(url)
+            summarized = scraper.summarize_events(raw_events)
+            flat = flatten_with_date(summarized)
+            run_ts = time.time()
+            last_run_ns = time.monotonic_ns()
+            extra_status = build_extra_status(
+                scraper=scraper,
+                flat_events=flat,
+                trigger=trigger,
+                interval=interval,
+                run_ts=run_ts,
+            )
+            if command_meta:
+                extra_status["last_command"] = command_meta
+            prev = last_events_count
+            # Update last events count (tracking for no-change detection)
+            last_events_count = len(flat)
+            no_changes = prev is not None and prev == len(flat)
             try:
-                url = config.scraping_url
-                raw_events, stats = scraper.scrape_events(url)
-                summarized = scraper.summarize_events(raw_events)
-                from .flatten import flatten_with_date
-
-                flat = flatten_with_date(summarized)
-                run_ts = time.time()
-                last_run = run_ts
-                from .service_cycle import build_extra_status
-
-                extra_status = build_extra_status(
-                    scraper=scraper,
-                    flat_events=flat,
-                    trigger=trigger,
-                    interval=interval,
-                    run_ts=run_ts,
-                )
-                if command_meta:
-                    extra_status["last_command"] = command_meta
-                prev = last_events_count["count"]
-                # Update last events count (tracking for no-change detection)
-                last_events_count["count"] = len(flat)  # type: ignore[assignment]
-                no_changes = prev is not None and prev == len(flat)
-                try:
-                    mqtt_pub.publish_events(
-                        flat, ai_processor, extra_status=extra_status
-                    )
-                    health_tracker.state.last_publish_success_at = time.time()
-                    health_tracker.state.publish_success_count += 1
-                except Exception as _pub_err:
-                    health_tracker.state.last_publish_failure_at = time.time()
-                    health_tracker.state.publish_failure_count += 1
-                    health_tracker.state.last_failure_reason = str(_pub_err)[:200]
-                    raise
-
-                # Write output files for web server
+                mqtt_pub.publish_events(flat, ai_processor, extra_status=extra_status)
+                health_tracker.state.last_publish_success_at = time.time()
+                health_tracker.state.publish_success_count += 1
+            except Exception as _pub_err:
+                health_tracker.state.last_publish_failure_at = time.time()
+                health_tracker.state.publish_failure_count += 1
+                health_tracker.state.last_failure_reason = str(_pub_err)[:200]
+                raise
+
+            # Write output files for web server
+            try:
+                _write_json(output_dir / "upcoming_events.json", {"events": flat})
+            except Exception as e:
+                logging.debug("Failed to write upcoming_events.json: %s", e)
+            if cal_gen:
                 try:
-                    (output_dir / "upcoming_events.json").write_text(
-                        json.dumps({"events": flat}, indent=2, default=str)
-                    )
+                    cal_gen.generate_ics_calendar(summarized, output_dir)
                 except Exception as e:
-                    logging.debug("Failed to write upcoming_events.json: %s", e)
-                if cal_gen:
-                    try:
-                        cal_gen.generate_ics_calendar(summarized, output_dir)
-                    except Exception as e:
-                        logging.debug("Failed to generate ICS: %s", e)
+                    logging.debug("Failed to generate ICS: %s", e)
 
-                logging.info(
-                    "service cycle completed trigger=%s events=%s", trigger, len(flat)
-                )
-                return {"events": len(flat), "no_changes": no_changes}
-            except Exception as e:  # pragma: no cover
-                logging.error("service cycle failed: %s", e)
-                raise
+            logging.info(
+                "service cycle completed trigger=%s events=%s", trigger, len(flat)
+            )
+            return {"events": len(flat), "no_changes": no_changes}
+        except Exception as e:  # pragma: no cover
+            logging.error("service cycle failed: %s", e)
+            raise
+        finally:
+            cycle_sema.release()
 
     client_id = f"{config.mqtt_client_id}-svc"
     # Use Paho MQTT v5 and Callback API v2 to avoid deprecation
@@ -1164,32 +1486,21 @@ def cmd_service(config: Config, args) -> int:
 
     # Configure TLS for the service command client (matches validator behavior)
     try:
-        tls_requested = False
+        # Each setting is looked up once and reused below
         try:
-            tls_requested = bool(config.get("mqtt.tls"))
+            cfg_tls = config.get("mqtt.tls")
         except Exception:
-            tls_requested = False
-        _tls_env = os.getenv("MQTT_USE_TLS")
-        if _tls_env and _tls_env.lower() in ("true", "1", "yes", "on"):
-            tls_requested = True
+            cfg_tls = None
+        tls_forced = (os.getenv("MQTT_USE_TLS") or "").lower() in _TRUE_STRS
         # Avoid enabling TLS implicitly on 1883 unless explicitly forced via env
-        if int(getattr(config, "mqtt_port", 1883) or 1883) == 1883 and not (
-            _tls_env and _tls_env.lower() in ("true", "1", "yes", "on")
-        ):
-            tls_requested = False
+        tls_requested = tls_forced or (
+            bool(cfg_tls) and int(getattr(config, "mqtt_port", 1883) or 1883) != 1883
+        )
         tls_verify_env = os.getenv("TLS_VERIFY")
         verify_flag: bool | None = None
         if tls_verify_env is not None:
-            try:
-                verify_flag = tls_verify_env.lower() in ("true", "1", "yes", "on")
-            except Exception:
-                verify_flag = None
+            verify_flag = tls_verify_env.lower() in _TRUE_STRS
         if tls_requested:
-            cfg_tls = None
-            try:
-                cfg_tls = config.get("mqtt.tls")
-            except Exception:
-                cfg_tls = None
             try:
                 if isinstance(cfg_tls, dict):
                     ca = cfg_tls.get("ca_certs")
@@ -1221,7 +1532,7 @@ def cmd_service(config: Config, args) -> int:
     except Exception:
         pass
 
-    last_connect_code: dict[str, int | None] = {"code": None}
+    last_connect_code: int | None = None
 
     def shutdown_sequence():  # pragma: no cover
         try:
@@ -1231,13 +1542,13 @@ def cmd_service(config: Config, args) -> int:
 
     install_global_signal_handler(shutdown_sequence, (signal.SIGTERM,))
 
-    from .command_processor import CommandProcessor
-    from .plugin_loader import load_command_plugins
-
     ACK_TOPIC = "twickenham_events/commands/ack"
     RESULT_TOPIC = "twickenham_events/commands/result"
     LAST_ACK_TOPIC = "twickenham_events/commands/last_ack"
     LAST_RESULT_TOPIC = "twickenham_events/commands/last_result"
+    LAST_COMMAND_TOPIC = "twickenham_events/status/last_command"
+    # Upper bound on waiting for restart's final result/acks to go out
+    RESTART_FLUSH_TIMEOUT = 1.0
     processor = CommandProcessor(paho_client, ACK_TOPIC, RESULT_TOPIC)  # type: ignore[call-arg]
     # Auto publish registry to retained discovery topic on every registration
     processor.enable_auto_registry_publish("twickenham_events/commands/registry")
@@ -1253,6 +1564,81 @@ def cmd_service(config: Config, args) -> int:
     except Exception as e:  # pragma: no cover
         logging.debug("Plugin loading failed: %s", e)
 
+    def publish_last_command(meta: dict[str, Any]) -> None:
+        """Record the most recent command on its small retained topic.
+
+        refresh and clear_cache both report here, so HA reads one place
+        (the Last Command sensor); refresh also keeps it in the status payload.
+        """
+        try:
+            paho_client.publish(
+                LAST_COMMAND_TOPIC,
+                dump_payload({"last_command": meta}),
+                qos=MIRROR_QOS,
+                retain=True,
+            )
+        except Exception:
+            pass
+
+    def publish_completion(
+        ctx: dict[str, Any],
+        command: str,
+        outcome: str,
+        message: str,
+        completed_ts: float | None = None,
+    ) -> list[Any]:
+        """Publish a command's result and final idle ack, each mirrored retained.
+
+        Best-effort so HA always clears busy; returns paho's MessageInfo
+        handles for whatever was queued.
+        """
+        infos: list[Any] = []
+        try:
+            payload_json = dump_payload(
+                {
+                    "id": ctx.get("id"),
+                    "command": ctx.get("command", command),
+                    "outcome": outcome,
+                    "message": message,
+                    "completed_ts": completed_ts or time.time(),
+                }
+            )
+            infos.append(paho_client.publish(RESULT_TOPIC, payload_json, retain=False))
+            # Mirror retained last_result for visibility post-restart
+            try:
+                infos.append(
+                    paho_client.publish(
+                        LAST_RESULT_TOPIC, payload_json, qos=MIRROR_QOS, retain=True
+                    )
+                )
+            except Exception:
+                pass
+            # Flip ack to idle as final state and mirror retained
+            ack_json = dump_payload(
+                {
+                    "status": "idle",
+                    "command": "idle",
+                    "id": ctx.get("id"),
+                    "completed_ts": time.time(),
+                }
+            )
+            infos.append(paho_client.publish(ACK_TOPIC, ack_json, retain=False))
+            try:
+                infos.append(
+                    paho_client.publish(
+                        LAST_ACK_TOPIC,
+                        ack_json,
+                        qos=MIRROR_QOS,
+                        retain=True,
+                        properties=last_ack_properties(),
+                    )
+                )
+            except Exception:
+                pass
+        except Exception:
+            pass
+        return infos
+
     def refresh_executor(ctx: dict[str, Any]):
         try:
             meta = {
@@ -1262,6 +1648,9 @@ def cmd_service(config: Config, args) -> int:
                 "received_ts": ctx.get("received_ts"),
             }
             result = run_cycle("command", command_meta=meta)
+            if result.get("busy"):
+                return "busy", "refresh already in progress", {}
+            publish_last_command({**meta, "completed_ts": time.time()})
             events = result.get("events", 0)
             if result.get("no_changes"):
                 details = f"events regenerated: {events} (no changes)"
@@ -1289,72 +1678,19 @@ def cmd_service(config: Config, args) -> int:
                 "received_ts": ctx.get("received_ts"),
                 "completed_ts": time.time(),
             }
-            # Try to reflect last_command in status payload (best-effort)
-            try:
-                mqtt_pub.publish_events(
-                    [], ai_processor, extra_status={"last_command": meta}
-                )
-            except Exception:
-                pass
-            # Explicitly publish result and mirrors
-            payload = {
-                "id": meta["id"],
-                "command": ctx.get("command", "clear_cache"),
-                "outcome": outcome,
-                "message": message,
-                "completed_ts": meta["completed_ts"],
-            }
-            try:
-                paho_client.publish(RESULT_TOPIC, json.dumps(payload), retain=False)
-                try:
-                    paho_client.publish(
-                        LAST_RESULT_TOPIC, json.dumps(payload), retain=True
-                    )
-                except Exception:
-                    pass
-                # Flip ack to idle as final state
-                ack_payload = {
-                    "status": "idle",
-                    "command": "idle",
-                    "id": meta["id"],
-                    "completed_ts": time.time(),
-                }
-                paho_client.publish(ACK_TOPIC, json.dumps(ack_payload), retain=False)
-                try:
-                    paho_client.publish(
-                        LAST_ACK_TOPIC, json.dumps(ack_payload), retain=True
-                    )
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            # Only last_command is recorded: republishing the full status
+            # here would also overwrite the event topics with an empty list
+            publish_last_command(meta)
+            # Explicitly publish result and idle ack, with their mirrors
+            publish_completion(
+                ctx, "clear_cache", outcome, message, meta["completed_ts"]
+            )
             return outcome, message, {}
         except Exception as e:  # pragma: no cover
             # Publish fatal error result as well to clear busy
-            try:
-                err_payload = {
-                    "id": ctx.get("id"),
-                    "command": ctx.get("command", "clear_cache"),
-                    "outcome": "fatal_error",
-                    "message": f"cache clear failed: {e}",
-                    "completed_ts": time.time(),
-                }
-                paho_client.publish(RESULT_TOPIC, json.dumps(err_payload), retain=False)
-                paho_client.publish(
-                    LAST_RESULT_TOPIC, json.dumps(err_payload), retain=True
-                )
-                ack_payload = {
-                    "status": "idle",
-                    "command": "idle",
-                    "id": ctx.get("id"),
-                    "completed_ts": time.time(),
-                }
-                paho_client.publish(ACK_TOPIC, json.dumps(ack_payload), retain=False)
-                paho_client.publish(
-                    LAST_ACK_TOPIC, json.dumps(ack_payload), retain=True
-                )
-            except Exception:
-                pass
+            publish_completion(
+                ctx, "clear_cache", "fatal_error", f"cache clear failed: {e}"
+            )
             return "fatal_error", f"cache clear failed: {e}", {}
 
     processor.register(
@@ -1378,40 +1714,28 @@ def cmd_service(config: Config, args) -> int:
         try:
             # Publish a quick result/idle ack ourselves to guarantee HA clears busy
             logging.info("Restart requested via command")
-            try:
-                payload = {
-                    "id": ctx.get("id"),
-                    "command": ctx.get("command", "restart"),
-                    "outcome": "success",
-                    "message": "service restarting",
-                    "completed_ts": time.time(),
-                }
-                paho_client.publish(RESULT_TOPIC, json.dumps(payload), retain=False)
-                # Also mirror retained last_result for visibility post-restart
+            infos = publish_completion(ctx, "restart", "success", "service restarting")
+            # Wait (bounded) for the result/acks to reach the socket rather
+            # than sleeping a fixed interval
+            wait_published(infos, RESTART_FLUSH_TIMEOUT)
+            restart_cmd = [sys.executable, "-m", "twickenham_events", "service"]
+            # Under a supervisor (systemd sets INVOCATION_ID; PID 1 adopts
+            # daemons) replace this process in place: same PID, no spawn race.
+            # The dropped connection fires the LWT; the new process comes
+            # back online as usual.
+            if os.environ.get("INVOCATION_ID") or os.getppid() == 1:
+                logging.info("Re-executing service in place: %s", restart_cmd)
+                # execv drops Python-level buffers; under systemd stdout and
+                # stderr are block-buffered pipes, so flush them first
+                for handler in logging.getLogger().handlers:
+                    handler.flush()
+                for stream in (sys.stdout, sys.stderr):
+                    if stream is not None:
+                        stream.flush()
                 try:
-                    paho_client.publish(
-                        LAST_RESULT_TOPIC, json.dumps(payload), retain=True
-                    )
-                except Exception:
-                    pass
-                # Send final idle ack and mirror retained
-                ack_payload = {
-                    "status": "idle",
-                    "command": "idle",
-                    "id": ctx.get("id"),
-                    "completed_ts": time.time(),
-                }
-                paho_client.publish(ACK_TOPIC, json.dumps(ack_payload), retain=False)
-                try:
-                    paho_client.publish(
-                        LAST_ACK_TOPIC, json.dumps(ack_payload), retain=True
-                    )
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            # Small delay to allow messages to flush
-            time.sleep(0.2)
+                    os.execv(sys.executable, restart_cmd)
+                except OSError as _exec_e:
+                    logging.warning("in-place restart failed: %s", _exec_e)
             # Optional: proactively start/enable systemd service so it comes back
             try:
                 sysd = config.get("service.systemd", {}) or {}
@@ -1430,8 +1754,6 @@ def cmd_service(config: Config, args) -> int:
                             "Skipping user systemctl: no D-Bus session available"
                         )
                     # Start (and optionally enable) the service; best-effort only
-                    import subprocess
-
                     try:
                         subprocess.run([*cmd_prefix, "daemon-reload"], check=False)
                     except Exception:
@@ -1449,21 +1771,14 @@ def cmd_service(config: Config, args) -> int:
                             pass
                 # Fallback: self-restart by spawning a detached child process
                 if not spawned and bool(sysd.get("fallback_self_restart", True)):
-                    from pathlib import Path
-                    import subprocess
-                    import sys
-
                     try:
                         proj_root = Path(__file__).resolve().parents[2]
                     except Exception:
-                        from os import getcwd
-
-                        proj_root = Path(getcwd())
-                    cmd = [sys.executable, "-m", "twickenham_events", "service"]
+                        proj_root = Path(os.getcwd())
                     try:
                         with open(os.devnull, "wb") as devnull:
                             subprocess.Popen(
-                                cmd,
+                                restart_cmd,
                                 cwd=str(proj_root),
                                 env=os.environ.copy(),
                                 stdout=devnull,
@@ -1480,22 +1795,15 @@ def cmd_service(config: Config, args) -> int:
                 logging.debug("systemd auto_launch skipped: %s", _e)
             # Final, robust path: spawn a detached child (if none spawned yet) and exit parent
             try:
-                from pathlib import Path
-                import subprocess
-                import sys
-
                 try:
                     proj_root = Path(__file__).resolve().parents[2]
                 except Exception:
-                    from os import getcwd
-
-                    proj_root = Path(getcwd())
+                    proj_root = Path(os.getcwd())
                 if not locals().get("spawned", False):
-                    cmd = [sys.executable, "-m", "twickenham_events", "service"]
-                    logging.info("Spawning detached child for restart: %s", cmd)
+                    logging.info("Spawning detached child for restart: %s", restart_cmd)
                     with open(os.devnull, "wb") as devnull:
                         subprocess.Popen(
-                            cmd,
+                            restart_cmd,
                             cwd=str(proj_root),
                             env=os.environ.copy(),
                             stdout=devnull,
@@ -1555,35 +1863,42 @@ def cmd_service(config: Config, args) -> int:
                     continue
             return None
 
+    # on_connect's subscriptions and legacy button topics, built once rather
+    # than on every (re)connect
+    cmd_subscriptions = [
+        (f"{config.get('app.unique_id_prefix', 'twickenham_events')}/cmd/#", 0),
+        # Also listen for our own result messages to publish a final 'idle' ack
+        (RESULT_TOPIC, 0),
+    ]
+    legacy_button_topics = tuple(
+        f"{config.service_discovery_prefix}/button/{uid}/config"
+        for uid in (
+            "tw_events_refresh",
+            "tw_events_clear_cache",
+            "twickenham_events_refresh",
+            "twickenham_events_clear_cache",
+        )
+    )
+
     def on_connect(client, userdata, *args, **kwargs):
+        nonlocal last_connect_code
         # Support both v1 and v2 paho callback signatures. Extract reason_code
         rc_val = extract_reason_code(*args, **kwargs)
         try:
             reason_code = int(rc_val) if rc_val is not None else 0
         except Exception:
             reason_code = 0
-        if last_connect_code["code"] == reason_code:
+        if last_connect_code == reason_code:
             return
-        last_connect_code["code"] = reason_code
+        last_connect_code = reason_code
         if reason_code == 0:
             health_tracker.state.connected = True
             health_tracker.state.last_connect_at = time.time()
             logging.info("service connected rc=%s", reason_code)
-            base = config.get("app.unique_id_prefix", "twickenham_events")
-            client.subscribe(f"{base}/cmd/#")
-            # Also listen for our own result messages to publish a final 'idle' ack
-            try:
-                client.subscribe(RESULT_TOPIC)
-            except Exception:  # pragma: no cover
-                pass
+            # One SUBSCRIBE packet for both topic filters
+            client.subscribe(cmd_subscriptions)
             try:
-                for uid in (
-                    "tw_events_refresh",
-                    "tw_events_clear_cache",
-                    "twickenham_events_refresh",
-                    "twickenham_events_clear_cache",
-                ):
-                    btn_topic = f"{config.service_discovery_prefix}/button/{uid}/config"
+                for btn_topic in legacy_button_topics:
                     client.publish(btn_topic, "", retain=True)
                 try:
                     # Create device and entities for standard discovery
@@ -1611,22 +1926,31 @@ def cmd_service(config: Config, args) -> int:
                 "service connect failed rc=%s (will not publish discovery)", reason_code
             )
 
+    # Commands are handled one at a time on their own thread: a refresh runs
+    # a full scrape, which must not stall paho's network loop (keepalives,
+    # acks) the way running it inside on_message would.
+    command_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+
+    def command_worker() -> None:
+        while (msg := command_queue.get()) is not None:
+            try:
+                handle_command_message(
+                    paho_client,
+                    config,
+                    processor,
+                    msg,
+                    ACK_TOPIC,
+                    LAST_ACK_TOPIC,
+                    RESULT_TOPIC,
+                    LAST_RESULT_TOPIC,
+                )
+            except Exception as e:  # pragma: no cover
+                logging.error("command handling failure: %s", e)
+
+    threading.Thread(target=command_worker, daemon=True, name="commands").start()
+
     def on_message(client, userdata, msg, *args, **kwargs):
-        try:
-            from .message_handler import handle_command_message
-
-            handle_command_message(
-                client,
-                config,
-                processor,
-                msg,
-                ACK_TOPIC,
-                LAST_ACK_TOPIC,
-                RESULT_TOPIC,
-                LAST_RESULT_TOPIC,
-            )
-        except Exception as e:  # pragma: no cover
-            logging.error("command handling failure: %s", e)
+        command_queue.put(msg)
 
     def on_disconnect(client, userdata, *args, **kwargs):
         health_tracker.state.connected = False
@@ -1675,6 +1999,7 @@ def cmd_service(config: Config, args) -> int:
 
     run_cycle("startup")
     if args.once:
+        command_queue.put(None)
         paho_client.loop_stop()
         paho_client.disconnect()
         return 0
@@ -1706,7 +2031,7 @@ def cmd_service(config: Config, args) -> int:
     )
     try:
         while not stop_flag["stop"]:
-            if time.time() - last_run >= interval:
+            if last_run_ns is None or time.monotonic_ns() - last_run_ns >= interval_ns:
                 run_cycle("interval")
             time.sleep(5)
     except KeyboardInterrupt:  # pragma: no cover
@@ -1714,6 +2039,7 @@ def cmd_service(config: Config, args) -> int:
     finally:
         if web_server:
             web_server.stop()
+        command_queue.put(None)
         availability.offline()
         paho_client.loop_stop()
         paho_client.disconnect()
@@ -1905,13 +2231,33 @@ def cmd_validate_config(config: Config, args) -> int:
         return 1
 
 
+# Command dispatch: handlers that load their own config from args.config ...
+_ARGS_COMMANDS: dict[str, Callable[[Any], int]] = {
+    "scrape": cmd_scrape,
+    "list": cmd_list,
+    "next": cmd_next,
+    "mqtt": cmd_mqtt,
+    "calendar": cmd_calendar,
+    "all": cmd_all,
+}
+# ... and handlers that are given the Config loaded by main()
+_CONFIG_COMMANDS: dict[str, Callable[[Config, Any], int]] = {
+    "status": cmd_status,
+    "cache": cmd_cache,
+    "service": cmd_service,
+    "validate": cmd_validate,
+    "commands": cmd_commands,
+}
+
+
 def main() -> int:
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = create_parser(argv)
+    args = parser.parse_args(argv)
 
     # Setup logging
-    _setup_logging(args.debug)
+    _setup_logging(args.debug, args.quiet)
 
     # Show help if no command provided
     if args.command is None:
@@ -1919,41 +2265,25 @@ def main() -> int:
         return 0
 
     try:
-        # Load configuration
-        config_path = args.config or "config/config.yaml"
-        config = Config.from_file(config_path)
-
         # Setup output directory
         output_dir = Path(args.output) if args.output else Path("output")
-        output_dir.mkdir(exist_ok=True)
-
-        # Route to command
-        if args.command == "scrape":
-            return cmd_scrape(args)
-        elif args.command == "list":
-            return cmd_list(args)
-        elif args.command == "next":
-            return cmd_next(args)
-        elif args.command == "mqtt":
-            return cmd_mqtt(args)
-        elif args.command == "calendar":
-            return cmd_calendar(args)
-        elif args.command == "all":
-            return cmd_all(args)
-        elif args.command == "status":
-            return cmd_status(config, args)
-        elif args.command == "cache":
-            return cmd_cache(config, args)
-        elif args.command == "service":
-            return cmd_service(config, args)
-        elif args.command == "validate":
-            return cmd_validate(config, args)
-        elif args.command == "commands":
-            return cmd_commands(config, args)
-        else:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Route to command; these load their configuration themselves
+        handler = _ARGS_COMMANDS.get(args.command)
+        if handler is not None:
+            return handler(args)
+
+        config_handler = _CONFIG_COMMANDS.get(args.command)
+        if config_handler is None:
             print(f"❌ Unknown command: {args.command}")
             return 1
 
+        # Load configuration for the commands that take it
+        config_path = args.config or "config/config.yaml"
+        config = _config_from_file(config_path)
+        return config_handler(config, args)
+
     except Exception as e:
         print(f"❌ Error: {e}")
         if args.debug:
@@ -13,6 +13,9 @@ from datetime import UTC, datetime
 import json
 from typing import Any
 
+# Compact separators; one shared encoder for every published payload
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
 
 def _iso_now() -> str:
     """Return current UTC time in ISO 8601 (Z) format without microseconds."""
@@ -101,9 +104,9 @@ try:
         ) -> None:
             if hasattr(self, "client") and hasattr(self.client, "publish"):
                 try:
-                    self.client.publish(topic, json.dumps(payload), retain=retain)
+                    self.client.publish(topic, _encode_json(payload), retain=retain)
                 except TypeError:
-                    self.client.publish(topic, json.dumps(payload))
+                    self.client.publish(topic, _encode_json(payload))
 
         def handle_raw(self, raw: str) -> None:  # type: ignore[override]
             """Parse a raw JSON command message and execute with cooldown support."""
@@ -242,10 +245,10 @@ except ImportError:  # pragma: no cover - fallback path used in tests
             """Publish the command registry to the specified topic."""
             payload = self.build_registry_payload()
             try:
-                self.client.publish(topic, json.dumps(payload), retain=retain)
+                self.client.publish(topic, _encode_json(payload), retain=retain)
             except TypeError:
                 # Some clients may not accept retain kw; fall back to positional
-                self.client.publish(topic, json.dumps(payload))
+                self.client.publish(topic, _encode_json(payload))
 
         def enable_auto_registry_publish(self, topic: str) -> None:
             """Record registry topic and publish immediately (minimal behavior)."""
@@ -260,9 +263,9 @@ except ImportError:  # pragma: no cover - fallback path used in tests
             self, topic: str, payload: dict[str, Any], *, retain: bool = False
         ) -> None:
             try:
-                self.client.publish(topic, json.dumps(payload), retain=retain)
+                self.client.publish(topic, _encode_json(payload), retain=retain)
             except TypeError:
-                self.client.publish(topic, json.dumps(payload))
+                self.client.publish(topic, _encode_json(payload))
 
         def handle_raw(self, raw: str) -> None:
             """Parse a raw JSON command message and execute with cooldown support."""
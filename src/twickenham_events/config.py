@@ -4,15 +4,23 @@ Configuration management for Twickenham Events.
 Provides a modern, type-safe configuration system with validation.
 """
 
+import json
 import os
 from pathlib import Path
 import random
+import stat
 import string
 from typing import Any
 
 from dotenv import dotenv_values
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed copy of a YAML config, stored next to it as <name>.cache.json
+_SIDECAR_SUFFIX = ".cache.json"
+
 # Lazy one-time .env loading flag
 _ENV_LOADED = False
 
@@ -48,6 +56,58 @@ def _load_env_once() -> None:
     _ENV_LOADED = True
 
 
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + _SIDECAR_SUFFIX)
+
+
+def _read_sidecar(path: Path, st: os.stat_result) -> dict | None:
+    """Return the cached parse of path, or None if missing or stale.
+
+    The sidecar records the YAML file's mtime_ns and size; any difference
+    means the YAML was edited since and must be parsed again.
+    """
+    try:
+        with open(_sidecar_path(path), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("size") == st.st_size
+        and isinstance(cached.get("data"), dict)
+    ):
+        return cached["data"]
+    return None
+
+
+def _write_sidecar(path: Path, st: os.stat_result, data: Any) -> None:
+    """Best-effort write of the JSON sidecar; never fails the config load."""
+    try:
+        payload = json.dumps(
+            {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+        )
+    except (TypeError, ValueError):
+        return  # YAML-only values (dates, sets, ...) have no JSON form
+    # Non-string keys come back as strings; only cache exact round trips
+    if json.loads(payload)["data"] != data:
+        return
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    # The sidecar holds the same secrets as the YAML (e.g. mqtt.password),
+    # so it gets the YAML's permission bits rather than the process umask
+    mode = stat.S_IMODE(st.st_mode)
+    try:
+        fd = os.open(tmp, os.O_CREAT | os.O_WRONLY | os.O_EXCL, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            os.fchmod(fd, mode)  # exact bits, whatever the umask
+            f.write(payload)
+        os.replace(tmp, sidecar)
+    except OSError:
+        # Read-only config dir (e.g. a container mount); just skip caching
+        tmp.unlink(missing_ok=True)
+
+
 class Config:
     """Configuration manager with validation and defaults."""
 
@@ -63,7 +123,11 @@ class Config:
     @classmethod
     def from_file(cls, config_path: str) -> "Config":
         _load_env_once()
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file.
+
+        The parsed data is cached in a JSON sidecar next to the file and
+        reused until the YAML's mtime or size changes.
+        """
         path = Path(config_path)
 
         if not path.exists():
@@ -74,8 +138,13 @@ class Config:
             if not path.exists():
                 raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        st = path.stat()
+        data = _read_sidecar(path, st)
+        if data is None:
+            with open(path) as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+            if isinstance(data, dict):
+                _write_sidecar(path, st, data)
 
         instance = cls(data)
         instance.config_path = str(path)
@@ -345,6 +414,15 @@ class Config:
             return str(env_val).lower() in ("true", "1", "yes", "on")
         return bool(enabled)
 
+    @property
+    def web_batch_enabled(self) -> bool:
+        """Check if the POST /batch endpoint is enabled (validation tooling)."""
+        enabled = self.get("web_server.batch_enabled", False)
+        env_val = os.getenv("WEB_SERVER_BATCH_ENABLED")
+        if env_val is not None:
+            return str(env_val).lower() in ("true", "1", "yes", "on")
+        return bool(enabled)
+
     @property
     def web_reload(self) -> bool:
         """Check if web server auto-reload is enabled (development)."""
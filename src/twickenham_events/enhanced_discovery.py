@@ -19,6 +19,7 @@ changes and keeps the public API here stable.
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from ha_mqtt_publisher import Device, Entity
@@ -60,6 +61,7 @@ def create_twickenham_entities(
     result_topic = "twickenham_events/commands/result"
     last_ack_topic = "twickenham_events/commands/last_ack"
     last_result_topic = "twickenham_events/commands/last_result"
+    last_command_topic = "twickenham_events/status/last_command"
 
     # IMPORTANT: Use short unique_ids here. Our Entity class will prefix them
     # with app.unique_id_prefix when building the payload unique_id. This
@@ -204,6 +206,19 @@ def create_twickenham_entities(
             icon="mdi:clock-check",
             entity_category="diagnostic",
         ),
+        Entity(
+            config,
+            device,
+            component="sensor",
+            unique_id="last_command",
+            name="Last Command",
+            state_topic=last_command_topic,
+            value_template="{{ value_json.last_command.name | default('') }}",
+            json_attributes_topic=last_command_topic,
+            json_attributes_template="{{ value_json.last_command | tojson }}",
+            icon="mdi:console",
+            entity_category="diagnostic",
+        ),
     ]
 
     # Conditionally add event count sensor
@@ -238,8 +253,6 @@ def publish_enhanced_device_discovery(
     `cmps` map where each entry has `p` set to the component and includes the
     standard entity options like topics and unique_id.
     """
-    import json
-
     # Build device and entities
     device = build_device(config)
     entities = create_twickenham_entities(config, device, include_event_count_component)
@@ -300,5 +313,7 @@ def publish_enhanced_device_discovery(
         payload["payload_not_available"] = "offline"
 
     # Publish retained bundle
-    mqtt_client.publish(topic=topic, payload=json.dumps(payload), retain=True)
+    mqtt_client.publish(
+        topic=topic, payload=json.dumps(payload, separators=(",", ":")), retain=True
+    )
     return topic
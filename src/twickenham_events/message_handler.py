@@ -6,11 +6,168 @@ previously embedded in __main__.py's on_message callback.
 
 from __future__ import annotations
 
+from functools import lru_cache
 import json
+import logging
 import time
 from typing import Any
 import uuid
 
+try:  # optional fast encoder/decoder; paho and the processor accept bytes
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:  # pragma: no cover - depends on environment
+    # Compact like orjson; a shared encoder skips per-call option handling
+    _dumps = json.JSONEncoder(separators=(",", ":")).encode
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Retained last_ack/last_result mirrors go out at QoS 1 so a dropped packet
+# can't lose the state HA reads back after a restart; transient acks stay QoS 0
+MIRROR_QOS = 1
+# MQTT v5 expiry for the retained last_ack, so a "busy" left behind by a
+# crashed service doesn't outlive it indefinitely
+LAST_ACK_EXPIRY_SECONDS = 3600
+
+# Busy ack shape; copied and filled in per command message
+_BUSY_ACK_TEMPLATE: dict[str, Any] = {
+    "status": "busy",
+    "command": None,
+    "received_ts": None,
+}
+
+
+@lru_cache(maxsize=1)
+def last_ack_properties() -> Any:
+    """PUBLISH properties for the retained last_ack mirror, built once.
+
+    None when paho is unavailable; paho drops properties on non-v5 sessions.
+    """
+    try:
+        from paho.mqtt.packettypes import PacketTypes
+        from paho.mqtt.properties import Properties
+    except ImportError:  # pragma: no cover - depends on environment
+        return None
+    props = Properties(PacketTypes.PUBLISH)
+    props.MessageExpiryInterval = LAST_ACK_EXPIRY_SECONDS
+    return props
+
+
+def _busy_ack(command: str, received_ts: float) -> dict[str, Any]:
+    ack = _BUSY_ACK_TEMPLATE.copy()
+    ack["command"] = command
+    ack["received_ts"] = received_ts
+    return ack
+
+
+def _publish_ack(
+    client: Any, ack_topic: str, last_ack_topic: str, ack: dict[str, Any]
+) -> None:
+    """Publish ack transiently and mirror it retained, serialising it once."""
+    payload = _dumps(ack)
+    client.publish(ack_topic, payload, qos=0, retain=False)
+    # Mirror retained last ack; failures propagate to the caller's guard
+    client.publish(
+        last_ack_topic,
+        payload,
+        qos=MIRROR_QOS,
+        retain=True,
+        properties=last_ack_properties(),
+    )
+
+
+def _handle_result(
+    client: Any,
+    text: str,
+    ack_topic: str,
+    last_ack_topic: str,
+    last_result_topic: str,
+) -> None:
+    """Mirror a command result retained and publish the final 'idle' ack."""
+    try:
+        # Try to carry over command id/name for traceability if present
+        result_obj = _loads(text) if text else {}
+        # Mirror result to retained topic for post-restart visibility; the
+        # payload just parsed is forwarded as-is rather than re-encoded.
+        # Guarded on its own so a failed mirror still lets the idle ack out.
+        try:
+            client.publish(
+                last_result_topic,
+                text.encode() if text else b"{}",
+                qos=MIRROR_QOS,
+                retain=True,
+            )
+        except Exception as e:
+            logger.debug("last_result mirror failed: %s", e)
+        ack_payload = {
+            "status": "idle",
+            "command": "idle",
+            "id": result_obj.get("id"),
+            "completed_ts": result_obj.get("completed_ts") or time.time(),
+        }
+        _publish_ack(client, ack_topic, last_ack_topic, ack_payload)
+    except Exception as e:
+        logger.debug("idle ack failed: %s", e)
+
+
+def _handle_cmd(
+    client: Any,
+    processor: Any,
+    cmd_name: str,
+    text: str,
+    ack_topic: str,
+    last_ack_topic: str,
+) -> None:
+    """Ack a command as busy and forward it to the processor."""
+    # If payload is "PRESS" (standard HA button) or empty, infer command from topic
+    if text == "" or text.upper() == "PRESS":
+        now = time.time()
+        try:
+            _publish_ack(client, ack_topic, last_ack_topic, _busy_ack(cmd_name, now))
+        except Exception as e:
+            logger.debug("busy ack failed: %s", e)
+        # Build a minimal JSON command envelope for the processor
+        cmd_obj = {
+            "id": str(uuid.uuid4()),
+            "command": cmd_name,
+            "requested_ts": now,
+            "received_ts": now,
+            "source": "ha_button",
+        }
+        try:
+            processor.handle_raw(_dumps(cmd_obj))
+        except Exception:
+            # Last resort: send a bare command structure
+            processor.handle_raw(_dumps({"command": cmd_name}))
+        return
+    # Otherwise, pass through payload (may be JSON with args/ids). If not JSON, wrap it.
+    try:
+        parsed = _loads(text)
+    except ValueError:  # json and orjson decode errors both subclass it
+        parsed = None
+    if isinstance(parsed, dict):
+        _obj = parsed
+        _cmd = parsed.get("name") or parsed.get("command") or text
+    else:
+        # Not a JSON object; wrap as a command name. A JSON string ("refresh")
+        # names the command by its decoded value, anything else by raw text
+        _cmd = parsed if isinstance(parsed, str) else text
+        _obj = {"command": _cmd.lower()}
+    try:
+        _publish_ack(
+            client, ack_topic, last_ack_topic, _busy_ack(str(_cmd).lower(), time.time())
+        )
+    except Exception as e:
+        logger.debug("busy ack failed: %s", e)
+    # Always forward JSON to the processor
+    processor.handle_raw(_dumps(_obj))
+
 
 def handle_command_message(
     client: Any,
@@ -27,9 +184,6 @@ def handle_command_message(
     Mirrors last ack/result to retained topics and publishes a transient ack
     with status busy/idle to ack_topic.
     """
-    base = config.get("app.unique_id_prefix", "twickenham_events")
-    cmd_prefix = f"{base}/cmd/"
-
     topic = getattr(msg, "topic", "") or ""
     payload_bytes: bytes = getattr(msg, "payload", b"") or b""
     text = payload_bytes.decode("utf-8", errors="ignore").strip()
@@ -37,96 +191,14 @@ def handle_command_message(
     # If we received a command result, mirror to retained last_result and
     # immediately publish a final 'idle' ack (also mirror retained last_ack)
     if topic == result_topic:
-        try:
-            # Try to carry over command id/name for traceability if present
-            result_obj = json.loads(text or "{}") if text else {}
-            # Mirror result to retained topic for post-restart visibility
-            try:
-                client.publish(
-                    last_result_topic, json.dumps(result_obj), qos=0, retain=True
-                )
-            except Exception:
-                pass
-            ack_payload = {
-                "status": "idle",
-                "command": "idle",
-                "id": result_obj.get("id"),
-                "completed_ts": result_obj.get("completed_ts") or time.time(),
-            }
-            client.publish(ack_topic, json.dumps(ack_payload), qos=0, retain=False)
-            # Mirror last ack retained as well
-            try:
-                client.publish(
-                    last_ack_topic, json.dumps(ack_payload), qos=0, retain=True
-                )
-            except Exception:
-                pass
-        except Exception:
-            pass
+        _handle_result(client, text, ack_topic, last_ack_topic, last_result_topic)
         return
 
+    base = config.get("app.unique_id_prefix", "twickenham_events")
+    cmd_prefix = f"{base}/cmd/"
     if topic.startswith(cmd_prefix):
         cmd_name = topic[len(cmd_prefix) :].strip().lower()
-        # If payload is "PRESS" (standard HA button) or empty, infer command from topic
-        if text == "" or text.upper() == "PRESS":
-            now = time.time()
-            try:
-                _ack = {
-                    "status": "busy",
-                    "command": cmd_name,
-                    "received_ts": now,
-                }
-                client.publish(ack_topic, json.dumps(_ack), qos=0, retain=False)
-                # Mirror retained last ack
-                try:
-                    client.publish(last_ack_topic, json.dumps(_ack), qos=0, retain=True)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            # Build a minimal JSON command envelope for the processor
-            cmd_obj = {
-                "id": str(uuid.uuid4()),
-                "command": cmd_name,
-                "requested_ts": now,
-                "received_ts": now,
-                "source": "ha_button",
-            }
-            try:
-                processor.handle_raw(json.dumps(cmd_obj))
-            except Exception:
-                # Last resort: send a bare command structure
-                processor.handle_raw(json.dumps({"command": cmd_name}))
-            return
-        # Otherwise, pass through payload (may be JSON with args/ids). If not JSON, wrap it.
-        _obj = None
-        try:
-            now = time.time()
-            _cmd = text
-            try:
-                _obj = json.loads(text)
-                _cmd = _obj.get("name") or _obj.get("command") or text
-            except Exception:
-                # Not JSON; wrap as a command name
-                _obj = {"command": str(text).strip().lower()}
-            _ack = {
-                "status": "busy",
-                "command": str(_cmd).lower(),
-                "received_ts": now,
-            }
-            client.publish(ack_topic, json.dumps(_ack), qos=0, retain=False)
-            try:
-                client.publish(last_ack_topic, json.dumps(_ack), qos=0, retain=True)
-            except Exception:
-                pass
-        except Exception:
-            pass
-        # Always forward JSON to the processor
-        try:
-            payload_for_processor = json.dumps(_obj) if isinstance(_obj, dict) else text
-        except Exception:
-            payload_for_processor = text
-        processor.handle_raw(payload_for_processor)
+        _handle_cmd(client, processor, cmd_name, text, ack_topic, last_ack_topic)
         return
 
     # Non-command topics (defensive; we only subscribe to cmd/#)
@@ -9,7 +9,9 @@ Enhancements:
 """
 
 from datetime import UTC, datetime as _datetime
+import importlib
 import logging
+import time
 from typing import Any, TypedDict, cast
 
 from .config import Config
@@ -65,46 +67,91 @@ class TodayPayload(TypedDict):
 
 logger = logging.getLogger(__name__)
 
-try:  # Import ha_mqtt_publisher from PyPI package
-    import importlib
 
-    _pub_mod = importlib.import_module("ha_mqtt_publisher.publisher")
-    # Runtime alias to the upstream implementation. Typed as Any so mypy won't
-    # complain about dynamic binding to a package-provided class.
-    PublisherImpl: Any = _pub_mod.MQTTPublisher
-    MQTT_AVAILABLE = True
-except Exception:
-    MQTT_AVAILABLE = False
-    logger.warning("ha-mqtt-publisher not available")
+class _FallbackMQTTPublisher:
+    """Fallback stub so references remain valid even if package missing."""
 
-    class MQTTPublisher:  # fallback stub
-        """Fallback stub so references remain valid even if package missing."""
+    def __init__(self, *_: object, **__: object) -> None:
+        # Permissive fallback: tests may monkeypatch this class or expect a
+        # context-manager that yields an object with a publish() method.
+        self._args = _
+        self._kwargs = __
 
-        def __init__(self, *_: object, **__: object) -> None:
-            # Permissive fallback: tests may monkeypatch this class or expect a
-            # context-manager that yields an object with a publish() method.
-            self._args = _
-            self._kwargs = __
+    def __enter__(self) -> "_FallbackMQTTPublisher":
+        return self
 
-        def __enter__(self) -> "MQTTPublisher":
-            return self
+    def __exit__(
+        self, exc_type: object | None, exc: object | None, tb: object | None
+    ) -> None:
+        return None
+
+    def publish(self, *_args: object, **_kwargs: object) -> object | None:
+        # Minimal behavior: return True to indicate success when possible,
+        # otherwise None. Tests generally patch this class or the module
+        # so behavior can be overridden.
+        return True
 
-        def __exit__(
-            self, exc_type: object | None, exc: object | None, tb: object | None
-        ) -> None:
-            return None
 
-        def publish(self, *_args: object, **_kwargs: object) -> object | None:
-            # Minimal behavior: return True to indicate success when possible,
-            # otherwise None. Tests generally patch this class or the module
-            # so behavior can be overridden.
-            return True
+# Names bound on first use by _load_publisher rather than at import time:
+# importing ha_mqtt_publisher (and paho with it) is the bulk of this module's
+# import cost, and callers that never publish should not pay it.
+_LAZY_PUBLISHER_NAMES = frozenset({"MQTTPublisher", "PublisherImpl", "MQTT_AVAILABLE"})
 
-    # Bind PublisherImpl to our fallback so call sites can refer to either name.
-    PublisherImpl = MQTTPublisher
 
-# Public alias expected by tests and call sites
-MQTTPublisher = PublisherImpl
+def _load_publisher() -> None:
+    """Import ha_mqtt_publisher from PyPI package and bind the lazy names."""
+    try:
+        _pub_mod = importlib.import_module("ha_mqtt_publisher.publisher")
+        # Runtime alias to the upstream implementation. Typed as Any so mypy
+        # won't complain about dynamic binding to a package-provided class.
+        impl: Any = _pub_mod.MQTTPublisher
+        available = True
+    except Exception:
+        logger.warning("ha-mqtt-publisher not available")
+        impl = _FallbackMQTTPublisher
+        available = False
+    # setdefault: a name already patched by a test must stay patched
+    g = globals()
+    g.setdefault("PublisherImpl", impl)
+    # Public alias expected by tests and call sites
+    g.setdefault("MQTTPublisher", impl)
+    g.setdefault("MQTT_AVAILABLE", available)
+
+
+def _publisher_attr(name: str) -> Any:
+    """Module-level lookup of a lazy name (honours monkeypatching)."""
+    g = globals()
+    if name not in g:
+        _load_publisher()
+    return g[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_PUBLISHER_NAMES:
+        return _publisher_attr(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Upper bound on waiting for the direct TLS path's publishes to be sent
+_DIRECT_FLUSH_TIMEOUT = 1.0
+
+
+def wait_published(infos: list[Any], timeout: float) -> None:
+    """Wait for a batch of paho publishes, sharing one deadline across them.
+
+    Failures are logged and swallowed: by this point the messages have been
+    handed to paho, so the caller must not fall back and publish again.
+    """
+    deadline = time.monotonic() + timeout
+    for info in infos:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.debug("publish flush timed out")
+            return
+        try:
+            info.wait_for_publish(timeout=remaining)
+        except (RuntimeError, ValueError) as e:
+            logger.debug("publish not confirmed: %s", e)
 
 
 def _get_web_server_status(config: Config) -> dict[str, Any]:
@@ -230,7 +277,7 @@ class MQTTClient:
 
         next_event = enhanced_events[0] if enhanced_events else None
 
-        if not MQTT_AVAILABLE:  # Extra safety
+        if not _publisher_attr("MQTT_AVAILABLE"):  # Extra safety
             logger.debug(
                 "MQTT library not available at import time; using fallback publisher if provided"
             )
@@ -254,6 +301,8 @@ class MQTTClient:
 
                 import paho.mqtt.client as _mqtt
 
+                _encode = _json.JSONEncoder(separators=(",", ":")).encode
+
                 # paho v2 exposes CallbackAPIVersion; handle v1 gracefully
                 _CBV = getattr(_mqtt, "CallbackAPIVersion", None)
 
@@ -383,31 +432,33 @@ class MQTTClient:
                             status_payload_direct[_k] = _v
                     except Exception:
                         pass
-                # Publish retained topics
-                _client.publish(
-                    topics.get("all_upcoming", "twickenham_events/events/all_upcoming"),
-                    _json.dumps(all_upcoming_payload_direct),
-                    retain=True,
-                )
-                _client.publish(
-                    topics.get("next", "twickenham_events/events/next"),
-                    _json.dumps(next_payload_direct),
-                    retain=True,
-                )
-                _client.publish(
-                    topics.get("status", "twickenham_events/status"),
-                    _json.dumps(status_payload_direct),
-                    retain=True,
-                )
-                _client.publish(
-                    topics.get("today", "twickenham_events/events/today"),
-                    _json.dumps(today_payload_direct),
-                    retain=True,
-                )
-                # Allow time for messages to be flushed to broker before disconnecting
-                import time
-
-                time.sleep(1)
+                # Publish retained topics back to back, then wait for the
+                # batch to be sent before disconnecting
+                infos = [
+                    _client.publish(
+                        topics.get(
+                            "all_upcoming", "twickenham_events/events/all_upcoming"
+                        ),
+                        _encode(all_upcoming_payload_direct),
+                        retain=True,
+                    ),
+                    _client.publish(
+                        topics.get("next", "twickenham_events/events/next"),
+                        _encode(next_payload_direct),
+                        retain=True,
+                    ),
+                    _client.publish(
+                        topics.get("status", "twickenham_events/status"),
+                        _encode(status_payload_direct),
+                        retain=True,
+                    ),
+                    _client.publish(
+                        topics.get("today", "twickenham_events/events/today"),
+                        _encode(today_payload_direct),
+                        retain=True,
+                    ),
+                ]
+                wait_published(infos, _DIRECT_FLUSH_TIMEOUT)
                 _client.loop_stop()
                 _client.disconnect()
                 logger.info(
@@ -419,7 +470,7 @@ class MQTTClient:
             pass
 
         # Use the module-level MQTTPublisher so tests can monkeypatch it.
-        pub_ctx = MQTTPublisher(**mqtt_config)
+        pub_ctx = _publisher_attr("MQTTPublisher")(**mqtt_config)
         with pub_ctx as publisher:
             ts = self._get_timestamp()
 
@@ -5,17 +5,21 @@ This module provides a generic FastAPI server that can be customized for differe
 projects. It's designed to be extracted into a separate web_host library.
 """
 
+import asyncio
 import json
 import logging
 from pathlib import Path
 from typing import Union
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException, Request
 from fastapi.responses import FileResponse, JSONResponse
 import uvicorn
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sub-requests accepted by one POST /batch
+MAX_BATCH_REQUESTS = 32
+
 
 class BaseFileServer:
     """
@@ -31,6 +35,7 @@ class BaseFileServer:
         description: str = "Simple file serving API",
         version: str = "1.0.0",
         base_path: Union[str, Path] | None = None,
+        enable_batch: bool = False,
     ):
         """
         Initialize the base file server.
@@ -40,6 +45,8 @@ class BaseFileServer:
             description: API description for OpenAPI docs
             version: API version
             base_path: Base directory for file serving (defaults to current directory)
+            enable_batch: Register POST /batch (off by default; kept out of the
+                OpenAPI docs)
         """
         self.app = FastAPI(
             title=title,
@@ -54,6 +61,8 @@ class BaseFileServer:
         self.file_routes: dict[str, tuple] = {}
 
         self._setup_default_routes()
+        if enable_batch:
+            self._setup_batch_route()
 
     def _setup_default_routes(self):
         """Setup default health and info routes."""
@@ -92,6 +101,101 @@ class BaseFileServer:
                 }
             }
 
+    def _setup_batch_route(self):
+        """Setup the opt-in POST /batch route used by validation tooling."""
+
+        @self.app.post("/batch", include_in_schema=False)
+        async def batch(request: Request, payload: dict = Body(...)):
+            """Run several GET requests in one round trip.
+
+            Body: {"requests": [{"method": "GET", "path": "/health"}, ...]}.
+            Returns the sub-responses in request order; HEAD sub-requests
+            run as GET but come back without a body.
+            """
+            # Sub-requests see the batch request's Host, so routes that build
+            # URLs from it behave as they would for a direct GET
+            host = request.headers.get("host", "localhost")
+            requests = payload.get("requests")
+            if not isinstance(requests, list) or len(requests) > MAX_BATCH_REQUESTS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"'requests' must be a list of at most {MAX_BATCH_REQUESTS}",
+                )
+            responses = []
+            for item in requests:
+                item = item if isinstance(item, dict) else {}
+                path = item.get("path")
+                method = str(item.get("method", "GET")).upper()
+                if (
+                    not isinstance(path, str)
+                    or not path.startswith("/")
+                    or method not in ("GET", "HEAD")
+                    or path.split("?", 1)[0] == "/batch"
+                ):
+                    responses.append(
+                        {"path": path, "status": 400, "headers": {}, "body": ""}
+                    )
+                    continue
+                result = await self._dispatch_get(path, host)
+                if method == "HEAD":
+                    result["body"] = ""
+                responses.append(result)
+            return {"responses": responses}
+
+    async def _dispatch_get(self, path: str, host: str = "localhost") -> dict:
+        """Run a GET through the app in-process and capture the response."""
+        route, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": route,
+            "raw_path": route.encode(),
+            "root_path": "",
+            "query_string": query.encode(),
+            "headers": [(b"host", host.encode("latin-1"))],
+            "client": None,
+            "server": None,
+        }
+        result: dict = {"path": path, "status": 500, "headers": {}}
+        body = bytearray()
+        request_sent = False
+        response_done = asyncio.Event()
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Like a real server: report the disconnect only once the
+            # response is complete, so streaming responses are not cut short
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                result["status"] = message["status"]
+                result["headers"] = {
+                    k.decode("latin-1"): v.decode("latin-1")
+                    for k, v in message.get("headers", [])
+                }
+            elif message["type"] == "http.response.body":
+                body.extend(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            # Starlette re-raises after sending its 500; report it for this
+            # entry only instead of failing the whole batch
+            logger.warning("Batch sub-request %s failed: %s", path, e)
+            return {"path": path, "status": 500, "headers": {}, "body": ""}
+        result["body"] = body.decode("utf-8", errors="replace")
+        return result
+
     def add_file_route(
         self,
         url_path: str,
@@ -37,6 +37,7 @@ class TwickenhamEventsServer(BaseFileServer):
             description="API for accessing Twickenham Stadium events calendar and data",
             version="1.0.0",
             base_path=output_dir or Path("output"),
+            enable_batch=config.web_batch_enabled,
         )
 
         self.config = config
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import pytest
+
+import twickenham_events.__main__ as mod
+from twickenham_events.__main__ import ScrapeResult, cmd_mqtt
+from twickenham_events.config import Config
+
+
+class FakeScraper:
+    def __init__(self, _cfg):
+        pass
+
+    def scrape_events(self, _url):  # pragma: no cover - must not be called
+        raise AssertionError("pre-scraped events should not be fetched again")
+
+    def find_next_event_and_summary(self, summarized):
+        return summarized[0]["events"][0], summarized[0]
+
+
+published: list = []
+
+
+class FakeMQTTClient:
+    def __init__(self, _cfg):
+        pass
+
+    def publish_events(self, events, _ai_processor):
+        published[:] = events
+
+
+class FakePublisher:
+    def __init__(self, **_cfg):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def patch_backends(monkeypatch):
+    for name, value in {
+        "AIProcessor": lambda _cfg: None,
+        "AvailabilityPublisher": lambda *_a: SimpleNamespace(online=lambda: None),
+        "EventScraper": FakeScraper,
+        "LibMQTTPublisher": FakePublisher,
+        "MQTTClient": FakeMQTTClient,
+        "publish_device_level_discovery": lambda **_kw: None,
+    }.items():
+        monkeypatch.setattr(mod, name, value, raising=False)
+    # Nothing reaches disk, so any attempt to re-read upcoming_events.json fails
+    monkeypatch.setattr(mod, "_write_json", lambda _path, _data: None)
+
+
+def test_cmd_mqtt_publishes_in_memory_scrape(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        "scraping:\n  url: https://example.invalid\nmqtt:\n  enabled: true\n"
+    )
+    event = {"fixture": "England v Wales", "date": "2099-02-01", "title": "x"}
+    summarized = [{"date": "2099-02-01", "events": [event]}]
+    stats = {"raw_events_count": 1, "fetch_duration": 0, "retry_attempts": 0}
+    args = SimpleNamespace(config=str(cfg), output=str(tmp_path), dry_run=False)
+
+    code = cmd_mqtt(args, pre_scraped=ScrapeResult([event], stats, summarized, []))
+
+    assert code == 0
+    assert published == [{"fixture": "England v Wales", "date": "2099-02-01"}]
+    assert not (tmp_path / "upcoming_events.json").exists()
+
+
+def test_cmd_mqtt_uses_config_passed_by_caller(tmp_path, monkeypatch):
+    def no_reload(_path):  # pragma: no cover - must not be called
+        raise AssertionError("config passed in should not be reloaded")
+
+    monkeypatch.setattr(mod, "_config_from_file", no_reload)
+    config = Config(
+        {"scraping": {"url": "https://example.invalid"}, "mqtt": {"enabled": True}}
+    )
+    event = {"fixture": "England v Italy", "date": "2099-03-01", "title": "x"}
+    summarized = [{"date": "2099-03-01", "events": [event]}]
+    stats = {"raw_events_count": 1, "fetch_duration": 0, "retry_attempts": 0}
+    args = SimpleNamespace(config="missing.yaml", output=str(tmp_path), dry_run=False)
+
+    scraped = ScrapeResult([event], stats, summarized, [])
+    assert cmd_mqtt(args, pre_scraped=scraped, config=config) == 0
+    assert published == [{"fixture": "England v Italy", "date": "2099-03-01"}]
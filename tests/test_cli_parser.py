@@ -0,0 +1,92 @@
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from twickenham_events.__main__ import (
+    _setup_logging,
+    _sniff_subcommand,
+    create_parser,
+)
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+# Backends that --help/--version must not import
+HEAVY_MODULES = (
+    "paho.mqtt.client",
+    "ha_mqtt_publisher",
+    "requests",
+    "bs4",
+    "icalendar",
+    "twickenham_events.ai_processor",
+    "twickenham_events.calendar_generator",
+    "twickenham_events.mqtt_client",
+    "twickenham_events.scraper",
+)
+
+
+def test_sniff_subcommand_skips_root_option_values():
+    assert _sniff_subcommand(["--output", "all", "scrape"]) == "scrape"
+    assert _sniff_subcommand(["--config=x.yaml", "list", "--limit", "3"]) == "list"
+    # Root help, no command and unknown commands fall back to the full parser
+    assert _sniff_subcommand(["-h", "next"]) is None
+    assert _sniff_subcommand(["--debug"]) is None
+    assert _sniff_subcommand(["bogus"]) is None
+
+
+def test_abbreviated_root_option_builds_every_command():
+    # argparse expands --out to --output, so "all" is its value, not a command
+    argv = ["--out", "all", "scrape"]
+    assert _sniff_subcommand(argv) is None
+    assert create_parser(argv).parse_args(argv).command == "scrape"
+
+
+def test_create_parser_builds_only_the_named_command():
+    parser = create_parser(["cache", "stats"])
+    args = parser.parse_args(["cache", "stats"])
+    assert (args.command, args.cache_command) == ("cache", "stats")
+
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+    assert list(subparsers.choices) == ["cache"]
+    full = create_parser()._subparsers._group_actions[0]  # type: ignore[union-attr]
+    assert "scrape" in full.choices and "commands" in full.choices
+
+
+def test_create_parser_skips_commands_for_leading_version():
+    parser = create_parser(["--config", "x.yaml", "--version", "list"])
+    assert not parser._subparsers._group_actions[0].choices  # type: ignore[union-attr]
+    # --version after the command is left to that command's parser
+    parser = create_parser(["list", "--version"])
+    assert list(parser._subparsers._group_actions[0].choices) == ["list"]  # type: ignore[union-attr]
+
+
+def test_help_does_not_import_backends():
+    # Fresh interpreter: this test session has already imported the backends
+    code = (
+        "import sys\n"
+        "import twickenham_events.__main__ as m\n"
+        "m.create_parser(['--help'])\n"
+        f"print([n for n in {HEAVY_MODULES!r} if n in sys.modules])\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_quiet_raises_log_level_unless_debug():
+    root = logging.getLogger()
+    saved = root.level
+    try:
+        assert create_parser(["--quiet", "list"]).parse_args(["--quiet", "list"]).quiet
+        _setup_logging(quiet=True)
+        assert root.level == logging.WARNING
+        _setup_logging(debug=True, quiet=True)
+        assert root.level == logging.DEBUG
+    finally:
+        root.setLevel(saved)
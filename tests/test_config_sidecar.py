@@ -0,0 +1,51 @@
+import json
+import os
+import stat
+
+from twickenham_events.config import Config
+
+
+def _write(path, text):
+    path.write_text(text)
+    return path
+
+
+def test_from_file_writes_and_reuses_json_sidecar(tmp_path):
+    cfg_path = _write(tmp_path / "config.yaml", "mqtt:\n  port: 1883\n")
+    sidecar = tmp_path / "config.yaml.cache.json"
+
+    assert Config.from_file(str(cfg_path)).get("mqtt.port") == 1883
+    cached = json.loads(sidecar.read_text())
+    assert cached["data"] == {"mqtt": {"port": 1883}}
+
+    # A fresh sidecar is read instead of the YAML
+    cached["data"]["mqtt"]["port"] = 8883
+    sidecar.write_text(json.dumps(cached))
+    assert Config.from_file(str(cfg_path)).get("mqtt.port") == 8883
+
+
+def test_from_file_reparses_yaml_after_edit(tmp_path):
+    cfg_path = _write(tmp_path / "config.yaml", "mqtt:\n  port: 1883\n")
+    Config.from_file(str(cfg_path))
+
+    _write(cfg_path, "mqtt:\n  port: 18830\n")
+    st = cfg_path.stat()
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert Config.from_file(str(cfg_path)).get("mqtt.port") == 18830
+
+
+def test_from_file_skips_sidecar_for_non_json_values(tmp_path):
+    cfg_path = _write(tmp_path / "config.yaml", "start: 2025-01-01\n1: one\n")
+
+    assert Config.from_file(str(cfg_path)).get("start") is not None
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
+def test_sidecar_keeps_yaml_file_mode(tmp_path):
+    cfg_path = _write(tmp_path / "config.yaml", "mqtt:\n  password: hunter2\n")
+    cfg_path.chmod(0o600)
+
+    Config.from_file(str(cfg_path))
+
+    sidecar = tmp_path / "config.yaml.cache.json"
+    assert stat.S_IMODE(sidecar.stat().st_mode) == 0o600
@@ -92,6 +92,13 @@ class TestConfigValidationScript:
             assert "❌" in result
             assert "should be true/false" in result
 
+    def test_truthy_accepts_all_true_spellings(self):
+        """Component toggles accept the same true values as validate_boolean."""
+        for value in ["true", "TRUE", "1", "yes", "On", " true "]:
+            assert validate_config._truthy(value)
+        for value in ["false", "0", "no", "off", "", "maybe"]:
+            assert not validate_config._truthy(value)
+
     def test_validate_port_valid(self):
         """Test port validation with valid values."""
         valid_ports = ["1", "80", "443", "8080", "47476", "65535"]
@@ -56,5 +56,8 @@ def test_device_level_discovery_includes_expire_after_and_retained_topics():
         "twickenham_events/cmd/clear_cache"
     )
     assert cmps["restart"]["command_topic"].endswith("twickenham_events/cmd/restart")
+    assert (
+        cmps["last_command"]["state_topic"] == "twickenham_events/status/last_command"
+    )
     assert cmps["clear_cache"]["name"] == "Clear All"
     assert cmps["restart"]["name"].lower().startswith("restart")
@@ -0,0 +1,112 @@
+import json
+from types import SimpleNamespace
+
+from twickenham_events.message_handler import (
+    LAST_ACK_EXPIRY_SECONDS,
+    handle_command_message,
+)
+
+ACK = "twickenham_events/commands/ack"
+LAST_ACK = "twickenham_events/commands/last_ack"
+RESULT = "twickenham_events/commands/result"
+LAST_RESULT = "twickenham_events/commands/last_result"
+
+
+class FakeConfig:
+    def get(self, key, default=None):
+        return default
+
+
+class FakeClient:
+    def __init__(self):
+        self.published = []
+        self.properties = {}
+
+    def publish(self, topic, payload, qos=0, retain=False, properties=None):
+        self.published.append((topic, json.loads(payload), qos, retain))
+        self.properties[topic] = properties
+
+
+class FakeProcessor:
+    def __init__(self):
+        self.raw = []
+
+    def handle_raw(self, raw):
+        self.raw.append(json.loads(raw))
+
+
+def _handle(topic, payload):
+    client, proc = FakeClient(), FakeProcessor()
+    msg = SimpleNamespace(topic=topic, payload=payload)
+    handle_command_message(
+        client, FakeConfig(), proc, msg, ACK, LAST_ACK, RESULT, LAST_RESULT
+    )
+    return client.published, proc.raw
+
+
+def test_button_press_acks_busy_and_forwards_envelope():
+    published, raw = _handle("twickenham_events/cmd/Refresh", b"PRESS")
+
+    assert [(t, qos, retain) for t, _, qos, retain in published] == [
+        (ACK, 0, False),
+        (LAST_ACK, 1, True),
+    ]
+    ack = published[0][1]
+    assert ack["status"] == "busy" and ack["command"] == "refresh"
+    assert published[1][1] == ack
+    assert raw[0]["command"] == "refresh"
+    assert raw[0]["source"] == "ha_button"
+
+
+def test_json_command_passes_through_to_processor():
+    published, raw = _handle("twickenham_events/cmd/x", b'{"name":"Clear","id":"a1"}')
+
+    assert published[0][1]["command"] == "clear"
+    assert raw == [{"name": "Clear", "id": "a1"}]
+
+
+def test_result_is_mirrored_and_acked_idle():
+    published, raw = _handle(RESULT, b'{"id":"a1","completed_ts":5}')
+
+    assert published == [
+        (LAST_RESULT, {"id": "a1", "completed_ts": 5}, 1, True),
+        (
+            ACK,
+            {"status": "idle", "command": "idle", "id": "a1", "completed_ts": 5},
+            0,
+            False,
+        ),
+        (
+            LAST_ACK,
+            {"status": "idle", "command": "idle", "id": "a1", "completed_ts": 5},
+            1,
+            True,
+        ),
+    ]
+    assert raw == []
+
+
+def test_only_retained_last_ack_carries_expiry():
+    client = FakeClient()
+    msg = SimpleNamespace(topic="twickenham_events/cmd/refresh", payload=b"")
+    handle_command_message(
+        client, FakeConfig(), FakeProcessor(), msg, ACK, LAST_ACK, RESULT, LAST_RESULT
+    )
+
+    assert client.properties[ACK] is None
+    expiry = client.properties[LAST_ACK].MessageExpiryInterval
+    assert expiry == LAST_ACK_EXPIRY_SECONDS
+
+
+def test_json_string_payload_uses_decoded_command_name():
+    published, raw = _handle("twickenham_events/cmd/custom", b'"Refresh"')
+
+    assert published[0][1]["command"] == "refresh"
+    assert raw == [{"command": "refresh"}]
+
+
+def test_plain_text_payload_is_wrapped_as_command_name():
+    published, raw = _handle("twickenham_events/cmd/custom", b"Clear_Cache")
+
+    assert published[0][1]["command"] == "clear_cache"
+    assert raw == [{"command": "clear_cache"}]
@@ -40,3 +40,22 @@ def test_mqtt_publish():
         mock_client.publish.assert_called_once_with(
             "test/topic", "test message", qos=0, retain=False
         )
+
+
+def test_direct_publish_flush_shares_one_deadline():
+    """Failed or slow publishes don't raise or extend the flush deadline."""
+    import time
+
+    from twickenham_events.mqtt_client import wait_published
+
+    failed = MagicMock()
+    failed.wait_for_publish.side_effect = RuntimeError("no connection")
+    slow = MagicMock()
+    slow.wait_for_publish.side_effect = lambda timeout: time.sleep(timeout)
+    never_waited = MagicMock()
+
+    wait_published([failed, slow, never_waited], timeout=0.05)
+
+    failed.wait_for_publish.assert_called_once()
+    assert slow.wait_for_publish.call_args.kwargs["timeout"] <= 0.05
+    never_waited.wait_for_publish.assert_not_called()
@@ -0,0 +1,71 @@
+"""
+Tests for the combined validation runner's scheduling of validators.
+"""
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+# Add scripts directory to path for importing validate_all
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import validate_all
+
+
+def _artifacts(tmp_path: Path) -> list[str]:
+    ics = tmp_path / "twickenham_events.ics"
+    ics.write_text("BEGIN:VCALENDAR\nEND:VCALENDAR\n", encoding="utf-8")
+    upcoming = tmp_path / "upcoming_events.json"
+    upcoming.write_text('{"events": []}', encoding="utf-8")
+    return ["--ics", str(ics), "--upcoming", str(upcoming)]
+
+
+def _record_runs(monkeypatch) -> list[str]:
+    """Replace run_validator with a stub logging start/end of each kind."""
+    log: list[str] = []
+    lock = threading.Lock()
+
+    def fake_run_validator(kind, args_list):
+        with lock:
+            log.append(f"start {kind}")
+        if kind != "mqtt":
+            time.sleep(0.05)
+        with lock:
+            log.append(f"end {kind}")
+        # A failing mqtt run skips the broker count lookup
+        return (1 if kind == "mqtt" else 0), ""
+
+    monkeypatch.setattr(validate_all, "run_validator", fake_run_validator)
+    return log
+
+
+def test_run_service_waits_for_file_validators(tmp_path, monkeypatch):
+    """The one-shot service rewrites the files, so it must not overlap reads."""
+    log = _record_runs(monkeypatch)
+
+    argv = [*_artifacts(tmp_path), "--mqtt", "--broker", "broker.test"]
+    assert validate_all.main([*argv, "--mqtt-run-service"]) == 1
+
+    assert log.index("start mqtt") > log.index("end ics")
+    assert log.index("start mqtt") > log.index("end upcoming")
+
+
+def test_mqtt_runs_alongside_file_validators(tmp_path, monkeypatch):
+    """Without the service run nothing is rewritten, so mqtt starts at once."""
+    log = _record_runs(monkeypatch)
+
+    argv = [*_artifacts(tmp_path), "--mqtt", "--broker", "broker.test"]
+    assert validate_all.main(argv) == 1
+
+    assert log.index("start mqtt") < log.index("end ics")
+
+
+def test_main_restores_stdout_and_stderr(tmp_path, monkeypatch):
+    """Per-thread output routing is undone when main() returns."""
+    _record_runs(monkeypatch)
+    out, err = sys.stdout, sys.stderr
+
+    assert validate_all.main(_artifacts(tmp_path)) == 0
+
+    assert sys.stdout is out
+    assert sys.stderr is err
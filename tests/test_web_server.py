@@ -124,6 +124,95 @@ END:VCALENDAR"""
         assert data["files"]["events"]["exists"] is True
 
 
+def test_batch_endpoint_disabled_by_default():
+    """Test that POST /batch is opt-in and never listed in the API docs."""
+    from fastapi.testclient import TestClient
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        server = TwickenhamEventsServer(Config.from_defaults(), Path(temp_dir))
+        client = TestClient(server.app)
+
+        assert client.post("/batch", json={"requests": []}).status_code in (404, 405)
+        assert "/batch" not in client.get("/openapi.json").json()["paths"]
+
+
+def test_batch_endpoint_runs_gets_in_order(monkeypatch):
+    """Test that POST /batch returns sub-responses in request order."""
+    monkeypatch.setenv("WEB_SERVER_BATCH_ENABLED", "true")
+    config = Config.from_defaults()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        server = TwickenhamEventsServer(config, temp_path)
+        (temp_path / "twickenham_events.ics").write_text(
+            "BEGIN:VCALENDAR\nEND:VCALENDAR"
+        )
+
+        from fastapi.testclient import TestClient
+
+        client = TestClient(server.app)
+
+        response = client.post(
+            "/batch",
+            json={
+                "requests": [
+                    {"method": "GET", "path": "/health"},
+                    {"method": "GET", "path": "/calendar"},
+                    {"method": "GET", "path": "/events"},
+                    {"method": "POST", "path": "/health"},
+                    {"method": "GET", "path": "/batch"},
+                    {"method": "HEAD", "path": "/calendar"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        results = response.json()["responses"]
+        assert [r["status"] for r in results] == [200, 200, 404, 400, 400, 200]
+        assert results[5]["body"] == ""
+        assert json.loads(results[0]["body"])["status"] == "healthy"
+        assert results[1]["headers"]["content-type"].startswith("text/calendar")
+        assert "BEGIN:VCALENDAR" in results[1]["body"]
+
+        # Oversized batches are rejected outright
+        response = client.post("/batch", json={"requests": [{}] * 33})
+        assert response.status_code == 400
+        assert "/batch" not in client.get("/openapi.json").json()["paths"]
+
+
+def test_batch_endpoint_isolates_failing_sub_requests(monkeypatch):
+    """Test that one raising route yields a 500 entry, not a failed batch."""
+    monkeypatch.setenv("WEB_SERVER_BATCH_ENABLED", "true")
+    from fastapi import Request
+    from fastapi.testclient import TestClient
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        server = TwickenhamEventsServer(Config.from_defaults(), Path(temp_dir))
+
+        @server.app.get("/boom")
+        async def boom():
+            raise RuntimeError("boom")
+
+        @server.app.get("/where")
+        async def where(request: Request):
+            return {"url": str(request.url_for("where"))}
+
+        client = TestClient(server.app)
+        response = client.post(
+            "/batch",
+            json={
+                "requests": [
+                    {"method": "GET", "path": "/boom"},
+                    {"method": "GET", "path": "/where"},
+                    {"method": "GET", "path": "/health"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        results = response.json()["responses"]
+        assert [r["status"] for r in results] == [500, 200, 200]
+        assert json.loads(results[1]["body"])["url"] == "http://testserver/where"
+
+
 if __name__ == "__main__":
     # Run a simple test
     test_server_initialization()
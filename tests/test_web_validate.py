@@ -0,0 +1,117 @@
+"""
+Tests for the web server validation script's probes against the real app.
+"""
+
+import asyncio
+from functools import partial
+from pathlib import Path
+import sys
+
+from fastapi.testclient import TestClient
+import httpx
+
+# Add scripts directory to path for importing web_validate
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import web_validate
+
+from twickenham_events.config import Config
+from twickenham_events.web import TwickenhamEventsServer
+
+STATUS_ONLY = ["/", "/health", "/status", "/files", "/events", "/calendar"]
+
+
+def _server(tmp_path: Path) -> TwickenhamEventsServer:
+    # An ICS file with no events: a ranged GET on /calendar answers 416
+    (tmp_path / "twickenham_events.ics").write_text("", encoding="utf-8")
+    (tmp_path / "upcoming_events.json").write_text(
+        '{"last_updated": "2026-01-01T00:00:00", "events": []}', encoding="utf-8"
+    )
+    return TwickenhamEventsServer(Config.from_defaults(), tmp_path)
+
+
+def _validator(client: httpx.Client) -> web_validate.WebServerValidator:
+    validator = web_validate.WebServerValidator(str(client.base_url))
+    validator.close()
+    validator._client = client
+    return validator
+
+
+def test_status_only_probes_send_one_head(tmp_path):
+    """Probes pass, and only the first one pays for the rejected HEAD."""
+    methods: list[str] = []
+    client = TestClient(_server(tmp_path).app)
+    client.event_hooks = {"request": [lambda request: methods.append(request.method)]}
+
+    with _validator(client) as validator:
+        assert validator._validate_probes([(path, None) for path in STATUS_ONLY])
+
+    assert validator.errors == []
+    assert methods.count("HEAD") == 1
+    assert len(methods) == len(STATUS_ONLY) + 1
+
+
+def test_concurrent_probes_send_one_head(tmp_path, monkeypatch):
+    """run_all holds the other status-only probes until HEAD has answered."""
+    methods: list[str] = []
+
+    async def record(request):
+        methods.append(request.method)
+
+    monkeypatch.setattr(
+        web_validate.httpx,
+        "AsyncClient",
+        partial(
+            httpx.AsyncClient,
+            transport=httpx.ASGITransport(app=_server(tmp_path).app),
+            event_hooks={"request": [record]},
+        ),
+    )
+    validator = web_validate.WebServerValidator("http://testserver")
+    try:
+        sections = [("status", [(path, None) for path in STATUS_ONLY])]
+        assert asyncio.run(validator.run_all(sections))
+    finally:
+        validator.close()
+
+    assert validator.errors == []
+    assert methods.count("HEAD") == 1
+    assert len(methods) == len(STATUS_ONLY) + 1
+
+
+def test_repeat_validation_revalidates_with_etag(monkeypatch):
+    """A second run sends If-None-Match and a 304 skips the content checks."""
+    from fastapi import FastAPI, Request, Response
+
+    app = FastAPI()
+    etag = '"calendar-v1"'
+    seen: list[str | None] = []
+
+    @app.get("/calendar")
+    async def calendar(request: Request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(
+            "BEGIN:VCALENDAR\nEND:VCALENDAR\n",
+            media_type="text/calendar",
+            headers={"ETag": etag},
+        )
+
+    checked: list[str] = []
+    apply_checks = web_validate.WebServerValidator._apply_checks
+
+    def counting_apply_checks(self, endpoint, *args):
+        checked.append(endpoint)
+        return apply_checks(self, endpoint, *args)
+
+    monkeypatch.setattr(
+        web_validate.WebServerValidator, "_apply_checks", counting_apply_checks
+    )
+
+    with _validator(TestClient(app)) as validator:
+        assert validator._validate_probes([web_validate.CALENDAR_PROBE])
+        assert validator._validate_probes([web_validate.CALENDAR_PROBE])
+
+    assert validator.errors == []
+    assert seen == [None, etag]
+    assert checked == ["/calendar"]